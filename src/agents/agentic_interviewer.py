@@ -1,5 +1,5 @@
 from typing import Dict, Any, List, Literal, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 from src.agents.candidate_state import CandidateState, Decision
 from src.agents.question_generator_agent import QuestionGeneratorAgent
 from src.services.job_service import job_service
@@ -205,7 +205,7 @@ class AgenticInterviewer:
         action = "continue" if should_continue else "terminate"
         
         return Decision(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             question_number=state.question_count,
             decision_type="terminate" if not should_continue else "continue",
             action=action,
@@ -271,7 +271,7 @@ class AgenticInterviewer:
         if new_difficulty != state.current_difficulty:
             state.current_difficulty = new_difficulty
             state.add_decision(Decision(
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=datetime.now(timezone.utc).isoformat(),
                 question_number=state.question_count,
                 decision_type="difficulty",
                 action=f"changed_to_{new_difficulty}",
@@ -333,7 +333,7 @@ class AgenticInterviewer:
                 state.skills_tested.add(skill)
                 
                 state.add_decision(Decision(
-                    timestamp=datetime.utcnow().isoformat(),
+                    timestamp=datetime.now(timezone.utc).isoformat(),
                     question_number=turn_no,
                     decision_type="skill_selection",
                     action=f"selected_{skill}",
@@ -390,7 +390,7 @@ class AgenticInterviewer:
 
             if should_add:
                 state.add_decision(Decision(
-                    timestamp=datetime.utcnow().isoformat(),
+                    timestamp=datetime.now(timezone.utc).isoformat(),
                     question_number=turn_no,
                     decision_type="add_followup",
                     action=followup_type,
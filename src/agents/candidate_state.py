@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from typing import List, Set, Dict, Any, Literal, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 @dataclass
 class Decision:
@@ -52,8 +52,8 @@ class CandidateState:
     repetitive_turns: List[int] = field(default_factory=list) # List of turn numbers flagged as repetitive
     
     # State metadata
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    last_updated: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    last_updated: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     
     @property
     def avg_score(self) -> float:
@@ -73,13 +73,13 @@ class CandidateState:
     def add_decision(self, decision: Decision):
         """Add a decision to history and update timestamp"""
         self.decisions_made.append(decision)
-        self.last_updated = datetime.utcnow().isoformat()
+        self.last_updated = datetime.now(timezone.utc).isoformat()
     
     def update_performance(self, score: float, category: str = "general"):
         """Update performance metrics after evaluation"""
         self.performance_trend.append(score)
         self.last_score = score
-        self.last_updated = datetime.utcnow().isoformat()
+        self.last_updated = datetime.now(timezone.utc).isoformat()
         
         # Category Tracking
         self.question_types.append(category)
@@ -182,6 +182,6 @@ class CandidateState:
             last_question_type=data.get("last_question_type", ""),
             last_answer=data.get("last_answer", ""),
             last_score=data.get("last_score", 0.0),
-            created_at=data.get("created_at", datetime.utcnow().isoformat()),
-            last_updated=data.get("last_updated", datetime.utcnow().isoformat())
+            created_at=data.get("created_at", datetime.now(timezone.utc).isoformat()),
+            last_updated=data.get("last_updated", datetime.now(timezone.utc).isoformat())
         )
@@ -1,9 +1,18 @@
 import os
-from groq import Groq
-from typing import Dict, Any, List
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from groq import Groq, AsyncGroq
+from typing import Dict, Any, List, Optional, Tuple
 import json
 from src.config import GROQ_API_KEY, GROQ_MODEL
 
+# Memoization of LLM evaluations for repeated (question, answer, type, rubric, job) inputs.
+# Long answers are effectively unique, so they bypass the cache.
+EVAL_CACHE_MAX_SIZE = 10_000
+EVAL_CACHE_MAX_ANSWER_CHARS = 500
+
 class EvaluatorAgent:
     """LLM-powered agent to evaluate candidate answers"""
     
@@ -12,12 +21,72 @@ class EvaluatorAgent:
             raise ValueError("Groq API Key (GROQ_API_KEY) is not set in EvaluatorAgent!")
         # OPTIMIZATION: Added timeout
         self.client = Groq(api_key=GROQ_API_KEY, timeout=15.0)
+        # Async client for concurrent final evaluations
+        self.async_client = AsyncGroq(api_key=GROQ_API_KEY, timeout=15.0)
         self.model_name = GROQ_MODEL
+        self._eval_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._eval_cache_lock = threading.Lock()
     
-    def evaluate_answer(self, question: str, answer: str, question_type: str, 
-                       rubric: Dict[str, Any], job_data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Evaluate a candidate's answer"""
+    async def aevaluate_answer(self, question: str, answer: str, question_type: str, 
+                               rubric: Dict[str, Any], job_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Evaluate a candidate's answer (async Groq client)"""
+        precheck = self._precheck(answer, question_type)
+        if precheck is not None:
+            return precheck
+        
+        cache_key = self._eval_cache_key(question, answer, question_type, rubric, job_data)
+        cached = self._eval_cache_get(cache_key)
+        if cached is not None:
+            return cached
         
+        prompt = self._build_evaluation_prompt(question, answer, question_type, rubric, job_data)
+        
+        try:
+            chat_completion = await self.async_client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model=self.model_name,
+                response_format={"type": "json_object"}
+            )
+            result, parsed = self._parse_evaluation(chat_completion.choices[0].message.content)
+            # Only cache real evaluations - a malformed response shouldn't stick as a low score
+            if parsed:
+                self._eval_cache_put(cache_key, result)
+            return result
+        except Exception:
+            # Fallback evaluation
+            return self._fallback_evaluation(answer)
+    
+    def _eval_cache_key(self, question: str, answer: str, question_type: str,
+                        rubric: Dict[str, Any], job_data: Dict[str, Any] = None) -> Optional[bytes]:
+        """Content hash for an evaluation request, or None if it shouldn't be cached"""
+        if len(answer) > EVAL_CACHE_MAX_ANSWER_CHARS:
+            return None
+        rubric_str = json.dumps(rubric, sort_keys=True, default=str) if rubric else ""
+        job_id = job_data.get("id", "") if job_data else ""
+        raw = "\x1f".join([question, answer, question_type, rubric_str, job_id])
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+    
+    def _eval_cache_get(self, key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        with self._eval_cache_lock:
+            cached = self._eval_cache.get(key)
+            if cached is None:
+                return None
+            self._eval_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    def _eval_cache_put(self, key: Optional[bytes], result: Dict[str, Any]) -> None:
+        if key is None:
+            return
+        with self._eval_cache_lock:
+            self._eval_cache[key] = copy.deepcopy(result)
+            self._eval_cache.move_to_end(key)
+            while len(self._eval_cache) > EVAL_CACHE_MAX_SIZE:
+                self._eval_cache.popitem(last=False)
+    
+    def _precheck(self, answer: str, question_type: str) -> Optional[Dict[str, Any]]:
+        """Deterministic result for turns that don't need the LLM, else None"""
         # MANDATORY OPTIMIZATION: Skip LLM call for low-signal turns
         # Check this FIRST so we don't flag "No" or "I'm good" as gibberish for these types
         if question_type.lower() in ["warmup", "candidate_questions", "wrapup"]:
@@ -40,6 +109,11 @@ class EvaluatorAgent:
                 "brief_reasoning": "Gibberish or nonsensical response detected"
             }
         
+        return None
+    
+    def _build_evaluation_prompt(self, question: str, answer: str, question_type: str,
+                                 rubric: Dict[str, Any], job_data: Dict[str, Any] = None) -> str:
+        """Build the full evaluation prompt"""
         # Add STAR structure checking ONLY for behavioral questions
         star_check = ""
         if question_type.lower() == 'behavioral':
@@ -146,23 +220,7 @@ SCORING MANDATE (CRITICAL):
 - NO SEARCHING FOR IMPROVEMENTS: If an answer is professionally sufficient, leave "improvements" EMPTY. Do not search for minor flaws to fill space.
 - DO NOT hallucinate technical depth if the answer doesn't contain any specific technical responses to the prompt.
 """
-        
-        try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model_name,
-                response_format={"type": "json_object"}
-            )
-            result = self._parse_evaluation(chat_completion.choices[0].message.content)
-            return result
-        except Exception as e:
-            # Fallback evaluation
-            return self._fallback_evaluation(answer)
+        return prompt
     
     def quick_evaluate(self, question: str, answer: str, question_type: str, job_level: str = "Mid") -> Dict[str, Any]:
         """High-speed, low-latency evaluation for adaptive difficulty logic"""
@@ -212,8 +270,8 @@ Return ONLY a JSON object: {{"score": <number>}}"""
         except:
             return {"technical": 5, "communication": 5, "structure": 5, "confidence": 5, "overall": 5}
 
-    def _parse_evaluation(self, response_text: str) -> Dict[str, Any]:
-        """Parse LLM evaluation response"""
+    def _parse_evaluation(self, response_text: str) -> Tuple[Dict[str, Any], bool]:
+        """Parse LLM evaluation response; returns (evaluation, parsed) - parsed is False for the fallback"""
         try:
             start = response_text.find('{')
             end = response_text.rfind('}') + 1
@@ -230,9 +288,9 @@ Return ONLY a JSON object: {{"score": <number>}}"""
                 else:
                     data[field] = 5.0
                     
-            return data
+            return data, True
         except:
-            return self._fallback_evaluation("")
+            return self._fallback_evaluation(""), False
     
     def _is_gibberish(self, answer: str, question_type: str = "technical") -> bool:
         """Detect gibberish/nonsense answers using multiple heuristics"""
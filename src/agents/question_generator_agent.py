@@ -1,19 +1,42 @@
 import os
+import logging
+import httpx
+import orjson
 from groq import Groq
 from typing import Dict, Any, List, TYPE_CHECKING
-import json
 from src.config import GROQ_API_KEY, GROQ_MODEL
 from src.services.job_service import job_service
 from src.agents.candidate_state import CandidateState
 
+logger = logging.getLogger(__name__)
+
+# Prompt budgets (characters) so one verbose answer can't blow up the context
+MAX_TURN_CHARS = 600
+MAX_HISTORY_CHARS = 2400
+MAX_TOPICS_CHARS = 200
+_TRUNCATION_MARKER = " ... [truncated] ... "
+
+def _trim_text(text: str, max_chars: int = MAX_TURN_CHARS) -> str:
+    """Keep the head and tail of long text, dropping the middle"""
+    if len(text) <= max_chars:
+        return text
+    keep = (max_chars - len(_TRUNCATION_MARKER)) // 2
+    return text[:keep] + _TRUNCATION_MARKER + text[-keep:]
+
 class QuestionGeneratorAgent:
     """LLM-powered agent to generate interview questions"""
     
     def __init__(self):
         if not GROQ_API_KEY:
             raise ValueError("Groq API Key (GROQ_API_KEY) is not set in QuestionGeneratorAgent!")
-        # OPTIMIZATION: Added timeout to prevent hanging connections
-        self.client = Groq(api_key=GROQ_API_KEY, timeout=15.0)
+        # OPTIMIZATION: Added timeout to prevent hanging connections. A short connect
+        # timeout fails fast on a dead route; the SDK's pooled client keeps connections
+        # alive between turns and retries 429/5xx/connection errors with backoff
+        self.client = Groq(
+            api_key=GROQ_API_KEY,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            max_retries=2
+        )
         self.model_name = GROQ_MODEL
     
     def generate_question(
@@ -39,18 +62,23 @@ class QuestionGeneratorAgent:
         # Create prompt for LLM
         prompt = self._create_prompt(q_type, job_data, previous_answers, difficulty, candidate_state)
         
+        # Expected JSON is ~100-200 tokens; cap output so a runaway generation
+        # can't stretch tail latency. Warmup/motivation prompts are shorter still.
+        max_tokens = 200 if q_type in ("warmup", "motivation") else 300
+        
         try:
             chat_completion = self.client.chat.completions.create(
                 messages=[{"role": "user", "content": prompt}],
                 model=self.model_name,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                max_tokens=max_tokens,
+                temperature=0.7,
+                top_p=0.9
             )
-            data = json.loads(chat_completion.choices[0].message.content)
+            data = orjson.loads(chat_completion.choices[0].message.content)
             return data
-        except Exception as e:
-            import traceback
-            print(f"[ERROR] LLM Question Generation Failed: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("LLM question generation failed (type=%s, turn=%s)", q_type, turn_no)
             return self._fallback_question(q_type, job_data)
     
     def _create_prompt(
@@ -228,7 +256,9 @@ Output Format:
         if q_type == 'technical' and candidate_state and hasattr(candidate_state, 'next_skill_to_test'):
             focus_area = f"Target skill: {candidate_state.next_skill_to_test}"
 
-        topics_covered = getattr(candidate_state, 'topics_covered', '') if candidate_state else ''
+        # Sorted, comma-joined names (not the set repr), capped like the other prompt inputs
+        topics = getattr(candidate_state, 'topics_covered', None) if candidate_state else None
+        topics_covered = _trim_text(", ".join(sorted(topics)), MAX_TOPICS_CHARS) if topics else "None"
 
         prompt = f"""You are an interviewer for a {job_level} {job_title}. 
 Question Type: {q_type}. Difficulty: {difficulty} ({difficulty_notes.get(difficulty)}).
@@ -268,13 +298,19 @@ Output Format:
         if not turns:
             return "No previous turns."
         
-        # Only take last 5 turns to keep prompt small
+        # Walk back from the latest turn until the character budget is spent
+        # (at most 5 turns) to keep the prompt small
         formatted = []
-        for t in turns[-5:]:
+        budget = MAX_HISTORY_CHARS
+        for t in reversed(turns[-5:]):
             speaker = "Interviewer" if t["speaker"] == "agent" else "Candidate"
-            formatted.append(f"{speaker}: {t['text']}")
+            line = f"{speaker}: {_trim_text(t['text'])}"
+            if len(line) > budget:
+                break
+            formatted.append(line)
+            budget -= len(line)
         
-        return "\n".join(formatted)
+        return "\n".join(reversed(formatted))
     
     def _fallback_question(self, q_type: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Simple fallback questions"""
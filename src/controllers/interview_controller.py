@@ -1,5 +1,11 @@
-import concurrent.futures
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import inspect
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional
 from src.services.session_service import SessionService
 from src.services.question_service import QuestionService
 from src.services.compliance_service import ComplianceService
@@ -16,6 +22,73 @@ from src.agents.candidate_state import CandidateState
 from src.services.state_persistence import StatePersistence
 from src.services.job_service import job_service
 
+logger = logging.getLogger(__name__)
+
+# OPTIMIZATION: Phrase lists compiled once into single-pass regexes
+_ASK_QUESTIONS_RE = re.compile("|".join(map(re.escape, [
+    "do you have any questions", "questions for me"
+])))
+_DECLINE_RE = re.compile("|".join(map(re.escape, [
+    "no question", "no, thank", "nothing", "i don't have", "i'm good", "that's all", "nope"
+])))
+
+# Transcript turns returned alongside the next question by get_interview_state
+RECENT_TURNS_LIMIT = 6
+
+# Cap on in-memory LangGraph states kept per process
+MAX_STATE_STORE_SIZE = 1000
+
+# Constant fields of a new interview's LangGraph state. List fields are
+# created per interview in create_interview so they are never shared.
+_INITIAL_STATE_TEMPLATE = {
+    "status": "CREATED",
+    "consent_granted": False,
+    "current_turn": 0,
+    "max_turns": 10,
+    "error": None
+}
+
+# Process-wide cap on concurrent answer evaluations, shared by every
+# interview finishing at the same time (instead of 5 per interview)
+MAX_EVAL_CONCURRENCY = min(32, (os.cpu_count() or 4) * 2)
+_eval_semaphore: Optional[asyncio.Semaphore] = None
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+_background_tasks: "set[asyncio.Task]" = set()
+
+
+def _run_in_background(coro, label: str) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it; failures are logged, not raised"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    
+    def _done(t: asyncio.Task):
+        _background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning("Background task '%s' failed: %s", label, t.exception())
+    
+    task.add_done_callback(_done)
+    return task
+
+
+def _report_progress(on_progress: Optional[Callable[[str], None]], stage: str) -> None:
+    """Forward a progress stage to an optional listener; listener errors never break the pipeline"""
+    if on_progress is None:
+        return
+    try:
+        on_progress(stage)
+    except Exception as e:
+        logger.debug("Progress listener failed: %s", e)
+
+
+def _get_eval_semaphore() -> asyncio.Semaphore:
+    """Create the shared evaluation semaphore lazily inside the running loop"""
+    global _eval_semaphore
+    if _eval_semaphore is None:
+        _eval_semaphore = asyncio.Semaphore(MAX_EVAL_CONCURRENCY)
+    return _eval_semaphore
+
 class InterviewController:
     """Business logic for interview operations"""
     
@@ -24,33 +97,32 @@ class InterviewController:
         self.agentic_interviewer = AgenticInterviewer()
         self.evaluator_agent = EvaluatorAgent()
         self.graph = interview_graph.get_graph()
-        # Store state in memory (in production, use persistent storage)
-        self.state_store = {}
+        # Store state in memory (durable state lives in StatePersistence).
+        # OPTIMIZATION: Bounded LRU so long-running workers don't grow without limit
+        self.state_store: "OrderedDict[str, InterviewState]" = OrderedDict()
+        # In-flight finish_interview tasks keyed by interview_id
+        self._finish_tasks: Dict[str, asyncio.Task] = {}
     
-    def create_interview(self, candidate_id: str, job_id: str, channel: str, consent_required: bool) -> Dict[str, Any]:
+    async def create_interview(self, candidate_id: str, job_id: str, channel: str, consent_required: bool) -> Dict[str, Any]:
         """Create a new interview session"""
         # P1: Check if candidate already has an active interview
-        existing_interview_id = SessionService.check_active_interview(candidate_id)
+        existing_interview_id = await asyncio.to_thread(SessionService.check_active_interview, candidate_id)
         if existing_interview_id:
             raise ValueError(f"Candidate {candidate_id} already has an active interview: {existing_interview_id}")
         
-        interview_id = SessionService.create_session(candidate_id, job_id, channel, consent_required)
+        interview_id = await asyncio.to_thread(SessionService.create_session, candidate_id, job_id, channel, consent_required)
         
-        # Initialize LangGraph state
+        # Initialize LangGraph state from the shared template (fresh lists per interview)
         initial_state: InterviewState = {
+            **_INITIAL_STATE_TEMPLATE,
             "interview_id": interview_id,
             "candidate_id": candidate_id,
             "job_id": job_id,
-            "status": "CREATED",
-            "consent_granted": False,
-            "current_turn": 0,
-            "max_turns": 10,
             "questions_asked": [],
             "answers_received": [],
-            "evaluation_scores": [],
-            "error": None
+            "evaluation_scores": []
         }
-        self.state_store[interview_id] = initial_state
+        self._remember_state(interview_id, initial_state)
         
         return {
             "interviewId": interview_id,
@@ -58,9 +130,16 @@ class InterviewController:
             "nextStep": "DISCLOSURE"
         }
     
-    def get_disclosure(self, interview_id: str) -> Dict[str, Any]:
+    def _remember_state(self, interview_id: str, graph_state: InterviewState) -> None:
+        """Store graph state, evicting the least recently used entry when full"""
+        self.state_store[interview_id] = graph_state
+        self.state_store.move_to_end(interview_id)
+        while len(self.state_store) > MAX_STATE_STORE_SIZE:
+            self.state_store.popitem(last=False)
+    
+    async def get_disclosure(self, interview_id: str) -> Dict[str, Any]:
         """Get disclosure text and update status"""
-        session = SessionService.get_session(interview_id)
+        session = await asyncio.to_thread(SessionService.get_session, interview_id)
         if not session:
             raise ValueError(f"Interview {interview_id} not found")
         
@@ -70,10 +149,10 @@ class InterviewController:
         # This prevents duplicate disclosure when called multiple times
         if session['status'] == 'CREATED':
             # Update status
-            SessionService.update_session_status(interview_id, "DISCLOSURE_DONE")
+            await asyncio.to_thread(SessionService.update_session_status, interview_id, "DISCLOSURE_DONE")
             
             # Save disclosure as a system turn (only once)
-            QuestionService.save_turn(interview_id, 0, "system", disclosure_text)
+            await asyncio.to_thread(QuestionService.save_turn, interview_id, 0, "system", disclosure_text)
         
         return {
             "interviewId": interview_id,
@@ -81,22 +160,24 @@ class InterviewController:
             "statusAfter": session['status'] if session['status'] != 'CREATED' else "DISCLOSURE_DONE"
         }
     
-    def submit_consent(self, interview_id: str, consent: str) -> Dict[str, Any]:
+    async def submit_consent(self, interview_id: str, consent: str) -> Dict[str, Any]:
         """Process consent response"""
-        session = SessionService.get_session(interview_id)
+        session = await asyncio.to_thread(SessionService.get_session, interview_id)
         if not session:
             raise ValueError(f"Interview {interview_id} not found")
         
         is_consent_granted = ComplianceService.validate_consent(consent)
         
         # Update LangGraph state
-        if interview_id in self.state_store:
-            self.state_store[interview_id]["consent_granted"] = is_consent_granted
-            self.state_store[interview_id]["status"] = "CONSENT_GRANTED" if is_consent_granted else "ENDED"
+        graph_state = self.state_store.get(interview_id)
+        if graph_state is not None:
+            self.state_store.move_to_end(interview_id)
+            graph_state["consent_granted"] = is_consent_granted
+            graph_state["status"] = "CONSENT_GRANTED" if is_consent_granted else "ENDED"
         
         if is_consent_granted:
-            SessionService.update_consent(interview_id, "granted", consent)
-            SessionService.update_session_status(interview_id, "CONSENT_GRANTED")
+            # OPTIMIZATION: consent and status transition in one UPDATE
+            await asyncio.to_thread(SessionService.update_consent, interview_id, "granted", consent, "CONSENT_GRANTED")
             
             return {
                 "consentStatus": "GRANTED",
@@ -104,8 +185,9 @@ class InterviewController:
                 "nextStep": "START_INTERVIEW"
             }
         else:
-            SessionService.update_consent(interview_id, "denied", consent)
-            SessionService.update_session_status(interview_id, "ENDED")
+            # Kept as two writes: the denial must be recorded even if the status change is rejected
+            await asyncio.to_thread(SessionService.update_consent, interview_id, "denied", consent)
+            await asyncio.to_thread(SessionService.update_session_status, interview_id, "ENDED")
             
             return {
                 "consentStatus": "DENIED",
@@ -113,42 +195,80 @@ class InterviewController:
                 "nextStep": None
             }
     
-    def get_next_question(self, interview_id: str) -> Dict[str, Any]:
+    async def get_next_question(self, interview_id: str) -> Dict[str, Any]:
         """Generate and return next question using agentic interviewer"""
-        session = SessionService.get_session(interview_id)
+        question, _turns = await self._generate_next_question(interview_id)
+        return question
+    
+    async def get_interview_state(self, interview_id: str) -> Dict[str, Any]:
+        """Next question plus the most recent transcript turns, in one call"""
+        # Reuses the transcript already loaded for question generation - no extra query
+        question, turns = await self._generate_next_question(interview_id)
+        return {
+            "nextQuestion": question,
+            "recentTurns": turns[-RECENT_TURNS_LIMIT:],
+            "status": "COMPLETED" if question.get("final") else "INTERVIEW_IN_PROGRESS"
+        }
+    
+    @staticmethod
+    def question_etag(interview_id: str, turn_no: int) -> str:
+        """Stable validator for the question asked at a given turn"""
+        return hashlib.sha1(f"{interview_id}:{turn_no}".encode()).hexdigest()
+    
+    async def get_pending_question_etag(self, interview_id: str) -> Optional[str]:
+        """
+        ETag of the latest question if it is still unanswered, else None.
+        Lets conditional requests skip generating (and saving) a new question.
+        """
+        last_turn_no = await asyncio.to_thread(QuestionService.get_last_turn_number, interview_id)
+        if not last_turn_no:
+            return None
+        # OPTIMIZATION: one query for all speakers of the last turn instead of per-speaker lookups.
+        # Filtering on turn_no (not "newest N rows") stays correct however many agent rows
+        # (duplicate questions, replies) the turn holds.
+        speakers = await asyncio.to_thread(QuestionService.get_turn_speakers, interview_id, last_turn_no)
+        if "agent" not in speakers or "candidate" in speakers:
+            return None
+        return self.question_etag(interview_id, last_turn_no)
+    
+    async def _generate_next_question(self, interview_id: str):
+        """Generate the next question; returns (question payload, transcript turns before it)"""
+        session = await asyncio.to_thread(SessionService.get_session, interview_id)
         if not session:
             raise ValueError(f"Interview {interview_id} not found")
         
         # Start interview if not started
         if session["status"] == "CONSENT_GRANTED":
-            SessionService.start_interview(interview_id)
+            await asyncio.to_thread(SessionService.start_interview, interview_id)
         
         # NEW: Load or create candidate state
-        state = StatePersistence.get_or_create_state( # Changed to use StatePersistence
-            interview_id=interview_id,
-            candidate_id=session["candidate_id"],
-            job_id=session["job_id"]
-        )
-        
         # FIX: Fetch real conversation history (memory)
-        turns = QuestionService.get_turns(interview_id)
+        # OPTIMIZATION: both reads are independent - one round trip of wall time instead of two
+        state, turns = await asyncio.gather(
+            asyncio.to_thread(
+                StatePersistence.get_or_create_state, # Changed to use StatePersistence
+                interview_id=interview_id,
+                candidate_id=session["candidate_id"],
+                job_id=session["job_id"]
+            ),
+            asyncio.to_thread(QuestionService.get_turns, interview_id)
+        )
         
         # NEW: Agent generates next question (makes autonomous decisions)
         try:
-            question_data = self.agentic_interviewer.generate_next_question(
+            question_data = await asyncio.to_thread(
+                self.agentic_interviewer.generate_next_question,
                 state=state, 
                 job_id=session["job_id"],
                 previous_answers=turns # Pass real history
             )
         except Exception as e:
-            print(f"CRITICAL ERROR in agent generation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("CRITICAL ERROR in agent generation: %s", e)
             
             # CRITICAL FIX: Increment turn count to prevent infinite loop
             # If we don't increment, we'll keep asking Q3 forever upon error
             state.question_count += 1
-            StatePersistence.save_state(state)
+            await asyncio.to_thread(StatePersistence.save_state, state)
             
             # Fallback question to prevent crash (AVOID BACKGROUND - already covered in warmup)
             question_data = {
@@ -159,7 +279,7 @@ class InterviewController:
         
         if not question_data:
             # Agent decided to finish
-            SessionService.finish_interview(interview_id)
+            await asyncio.to_thread(SessionService.finish_interview, interview_id)
             # Return with required fields to satisfy API validation
             return {
                 "turnNo": state.question_count,
@@ -170,7 +290,7 @@ class InterviewController:
                 "final": True,
                 "message": "Interview completed",
                 "totalQuestions": state.question_count
-            }
+            }, turns
         
         # Calculate actual turn number (now synchronized by agentic interviewer)
         next_turn_no = state.question_count
@@ -181,11 +301,11 @@ class InterviewController:
             state.question_rubrics[next_turn_no] = question_data["rubric"]
         
         # Save question as agent turn FIRST to ensure transcript persistence
-        QuestionService.save_turn(interview_id, next_turn_no, "agent", question_data["question"])
+        await asyncio.to_thread(QuestionService.save_turn, interview_id, next_turn_no, "agent", question_data["question"])
         
         # [ATOMICITY REFINEMENT] Save state AFTER transcript is persisted
         # This prevents the state from advancing its turn count if the DB write fails.
-        StatePersistence.save_state(state)
+        await asyncio.to_thread(StatePersistence.save_state, state)
         
         return {
             "turnNo": next_turn_no,
@@ -194,58 +314,57 @@ class InterviewController:
             "expectedSignals": question_data.get("rubric", {}).get("mustMention", []),
             "agentDifficulty": state.current_difficulty, # Directly from state
             "totalQuestions": f"{state.question_count + 1}/10-12"
-        }
+        }, turns
     
-    def submit_answer(self, interview_id: str, turn_no: int, answer: str) -> Dict[str, Any]:
-        """Process candidate answer (Deferred Evaluation to save API hits)"""
+    async def submit_answer(self, interview_id: str, turn_no: int, answer: str,
+                            include_next_question: bool = False) -> Dict[str, Any]:
+        """
+        Process candidate answer (Deferred Evaluation to save API hits).
+        With include_next_question, the next question and recent turns are returned
+        in the same response, saving the client a round trip.
+        """
         try:
-            session = SessionService.get_session(interview_id)
+            session = await asyncio.to_thread(SessionService.get_session, interview_id)
             if not session:
                 raise ValueError(f"Interview {interview_id} not found")
             
-            # Save answer immediately to transcript
-            QuestionService.save_turn(interview_id, turn_no, "candidate", answer)
+            # Save answer immediately (before any LLM call), alongside the lookups below -
+            # they only read the agent question and earlier answers, so the insert can't affect them
+            # OPTIMIZATION: Fetch only the matching question and the earlier answers
+            # instead of pulling the whole transcript on every answer
+            _, question_turn, previous_candidate_answers = await asyncio.gather(
+                asyncio.to_thread(QuestionService.save_turn, interview_id, turn_no, "candidate", answer),
+                asyncio.to_thread(QuestionService.get_turn, interview_id, turn_no, "agent"),
+                asyncio.to_thread(QuestionService.get_candidate_answers, interview_id, turn_no)
+            )
             
             # CHECK: If previous question was candidate_questions type, generate LLM response
-            turns = QuestionService.get_turns(interview_id)
-            # Find the question that corresponds to this answer
-            question_turn = None
-            for turn in reversed(turns):
-                if turn["speaker"] == "agent" and turn["turn_no"] == turn_no:
-                    question_text = turn.get("text", "").lower()
-                    if "do you have any questions" in question_text or "questions for me" in question_text:
-                        question_turn = turn
-                        break
+            if question_turn:
+                question_text = (question_turn.get("text") or "").lower()
+                if not _ASK_QUESTIONS_RE.search(question_text):
+                    question_turn = None
             
             # If it's candidate_questions and candidate asked something (not declining)
             if question_turn:
-                answer_lower = answer.lower().strip()
-                is_declining = any(phrase in answer_lower for phrase in [
-                    "no question", "no, thank", "nothing", "i don't have", "i'm good", "that's all", "nope"
-                ])
+                is_declining = _DECLINE_RE.search(answer.lower()) is not None
                 
                 if not is_declining and len(answer.strip()) > 10:  # Candidate asked something
                     try:
-                        llm_response = self.agentic_interviewer.generate_answer_to_candidate_question(
+                        llm_response = await asyncio.to_thread(
+                            self.agentic_interviewer.generate_answer_to_candidate_question,
                             candidate_question=answer,
                             job_id=session["job_id"]
                         )
                         
                         # Save the LLM's response as an additional turn
-                        QuestionService.save_turn(
-                            interview_id=interview_id,
-                            turn_no=turn_no,
-                            speaker="agent",
-                            text=llm_response
-                        )
+                        await asyncio.to_thread(QuestionService.save_turn, interview_id, turn_no, "agent", llm_response)
                         
-                        print(f"[INFO] Generated response to candidate question: {llm_response[:100]}...")
+                        logger.info("Generated response to candidate question: %s...", llm_response[:100])
                     except Exception as e:
-                        print(f"[ERROR] Failed to generate response to candidate question: {e}")
+                        logger.error("Failed to generate response to candidate question: %s", e)
             
             # REPETITION DETECTION: Check for redundant answers
             is_repetitive = False
-            previous_candidate_answers = [t["text"] for t in turns if t["speaker"] == "candidate" and t["turn_no"] < turn_no]
             
             curr_ans_clean = answer.lower().strip()
             if len(curr_ans_clean) > 50: # Only check significant answers
@@ -264,17 +383,15 @@ class InterviewController:
                     
                     if similarity > 0.85: # 85% overlap in words
                         is_repetitive = True
-                        print(f"[WARN] REPETITIVE ANSWER DETECTED: {similarity*100:.1f}% similarity")
+                        logger.warning("REPETITIVE ANSWER DETECTED: %.1f%% similarity", similarity * 100)
                         break
 
             # API REDUCTION: We perform a LIGHTWEIGHT evaluation here 
             # to enable adaptive difficulty, but skip the full heavy analysis.
-            print("\n" + "="*50)
-            print(f"🔍 REAL-TIME EVALUATION STARTED: Turn {turn_no}")
-            print("="*50)
+            logger.info("REAL-TIME EVALUATION STARTED: Turn %s", turn_no)
             try:
                 # 1. Load state
-                state = StatePersistence.load_state(interview_id)
+                state = await asyncio.to_thread(StatePersistence.load_state, interview_id)
                 if state:
                     # [NEW] Persist repetition status
                     if is_repetitive:
@@ -285,7 +402,8 @@ class InterviewController:
                     job_data = job_service.get_job(session.get("job_id", ""))
                     job_level = job_data.get("level", "Mid") if job_data else "Mid"
                     
-                    eval_result = self.evaluator_agent.quick_evaluate(
+                    eval_result = await asyncio.to_thread(
+                        self.evaluator_agent.quick_evaluate,
                         question=state.last_question or "Context", 
                         answer=answer,
                         question_type=state.last_question_type or "technical",
@@ -293,7 +411,7 @@ class InterviewController:
                     )
                     
                     score = eval_result.get('overall', 5)
-                    print(f"✅ QUICK SCORE: {score}/10")
+                    logger.info("QUICK SCORE: %s/10", score)
                     
                     # 3. Update state for difficulty adaptation
                     self.agentic_interviewer.update_state_after_evaluation(
@@ -305,109 +423,142 @@ class InterviewController:
                     )
                     
                     # 4. Save state to persist difficulty decision
-                    StatePersistence.save_state(state)
-                    print(f"📈 DIFFICULTY UPDATE: {state.current_difficulty.upper()}")
-                    print("="*50 + "\n")
+                    await asyncio.to_thread(StatePersistence.save_state, state)
+                    logger.info("DIFFICULTY UPDATE: %s", state.current_difficulty.upper())
             except Exception as e:
-                print(f"❌ [WARN] Lightweight evaluation failed: {e}")
-                print("="*50 + "\n")
+                logger.warning("Lightweight evaluation failed: %s", e)
 
-            return {
+            result = {
                 "received": True,
                 "status": "INTERVIEW_IN_PROGRESS",
                 "nextStep": "NEXT_QUESTION"
             }
+            
+            if include_next_question:
+                # The answer is already stored, so a failure here must not fail the
+                # request (a client retry would duplicate the answer) - the client
+                # falls back to fetching the question separately
+                try:
+                    interview_state = await self.get_interview_state(interview_id)
+                    result["nextQuestion"] = interview_state["nextQuestion"]
+                    result["recentTurns"] = interview_state["recentTurns"]
+                    result["status"] = interview_state["status"]
+                except Exception as e:
+                    logger.warning("Inline next question failed for %s: %s", interview_id, e)
+            
+            return result
         except Exception as e:
-            print(f"[ERROR] submit_answer failed: {str(e)}")
+            logger.error("submit_answer failed: %s", e)
             raise
     
-    def get_turns(self, interview_id: str) -> List[Dict[str, Any]]:
-        """Get full transcript of the interview"""
+    async def iter_turn_pages(self, interview_id: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Full transcript of the interview, one page at a time (never held in memory as a whole)"""
+        pages = QuestionService.iter_turn_pages(interview_id)
         try:
-            return QuestionService.get_turns(interview_id)
+            while (page := await asyncio.to_thread(next, pages, None)) is not None:
+                yield page
         except Exception as e:
-            print(f"[ERROR] get_turns failed: {str(e)}")
+            logger.error("get_turns failed: %s", e)
             raise
             
-    def finish_interview(self, interview_id: str) -> Dict[str, Any]:
+    async def finish_interview(self, interview_id: str,
+                               on_progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Finish interview, de-duplicating concurrent retries for the same interview.
+        on_progress (optional) is called with a short stage description as work completes;
+        a call that joins an in-flight finish gets no progress updates.
+        """
+        # IDEMPOTENCY: A retry while the first call is still running joins it
+        # instead of re-running every LLM evaluation
+        task = self._finish_tasks.get(interview_id)
+        if task is None:
+            task = asyncio.create_task(self._finish_interview(interview_id, on_progress))
+            self._finish_tasks[interview_id] = task
+            task.add_done_callback(lambda _t: self._finish_tasks.pop(interview_id, None))
+        return await asyncio.shield(task)
+    
+    async def _finish_interview(self, interview_id: str,
+                                on_progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Finish interview and generate report with absolute robustness"""
         try:
-            session = SessionService.get_session(interview_id)
+            # 1. Gather all data
+            # OPTIMIZATION: session + transcript in one embedded query, concurrently with the
+            # candidate state (for saved rubrics) - a single round trip of wall time
+            _report_progress(on_progress, "Loading interview transcript")
+            (session, turns), state = await asyncio.gather(
+                self._load_session_with_turns(interview_id),
+                asyncio.to_thread(StatePersistence.load_state, interview_id)
+            )
             if not session:
                 raise ValueError(f"Interview {interview_id} not found")
             
-            # 1. Gather all data
-            turns = QuestionService.get_turns(interview_id)
-            print(f"[DEBUG] Processing {len(turns)} turns for {interview_id}")
+            # IDEMPOTENCY: Already finished and scored - return the stored result.
+            # (Status alone isn't enough: the last question marks the session COMPLETED
+            # before /finish runs.)
+            if session.get("status") == "COMPLETED":
+                stored_scores = await asyncio.to_thread(ScoringService.get_scores, interview_id)
+                if stored_scores:
+                    logger.info("finish_interview: %s already scored, returning stored result", interview_id)
+                    return self._finish_response_from_scores(interview_id, stored_scores)
             
-            # 2. Parallel Evaluation (Core Intelligence)
-            try:
-                job_data = job_service.get_job(session["job_id"])
-                # Pass state for access to saved rubrics
-                state = StatePersistence.load_state(interview_id)
-                evaluations = self._evaluate_all_answers(turns, job_data, state)
-            except Exception as e:
-                print(f"[ERROR] Parallel evaluation failed: {e}")
-                evaluations = []
+            logger.debug("Processing %d turns for %s", len(turns), interview_id)
+            
+            # 2 + 4. Evaluations and signals are independent - run them concurrently
+            job_data = job_service.get_job(session["job_id"])
+            qa_pairs = self._extract_qa_pairs(turns)
+            evaluations, signals = await asyncio.gather(
+                self._guarded_step(
+                    "Parallel evaluation",
+                    lambda: self._evaluate_all_answers(qa_pairs, job_data, state, on_progress),
+                    fallback=[]
+                ),
+                self._guarded_step(
+                    "SignalsService",
+                    lambda: asyncio.to_thread(SignalsService.calculate_signals, interview_id, turns)
+                )
+            )
+            # Only calculated signals are persisted; the fallback is for the response path
+            calculated_signals = signals
+            if signals is None:
+                signals = {"talk_ratio": 0.5, "sentiment": "neutral", "call_quality_score": 100}
             
             # 3. Score Aggregation
+            _report_progress(on_progress, "Compiling scores and recommendation")
             scores = self.evaluator_agent.aggregate_scores(evaluations)
             scores["job_id"] = session.get("job_id", "") # Inject for recommendation logic
             
-            # 4. Signals Calculation
-            try:
-                signals = SignalsService.calculate_signals(interview_id, turns)
-                SignalsService.save_signals(interview_id, signals)
-            except Exception as e:
-                print(f"[ERROR] SignalsService failed: {e}")
-                signals = {"talk_ratio": 0.5, "sentiment": "neutral", "call_quality_score": 100}
-            
             # 5. Summary Generation (now includes evaluations)
-            try:
-                summary = SummaryService.generate_summary(interview_id, scores, turns, evaluations)
-            except Exception as e:
-                print(f"[ERROR] SummaryService failed: {e}")
-                summary = {
+            summary = await self._guarded_step(
+                "SummaryService",
+                lambda: SummaryService.generate_summary(interview_id, scores, turns, evaluations),
+                fallback={
                     "recommendation": "HOLD",
                     "highlights": ["Data gathered successfully"],
                     "concerns": ["Internal summary generator error"],
-                    "num_questions_answered": len([t for t in turns if t["speaker"] == "candidate"])
+                    "num_questions_answered": sum(1 for t in turns if t["speaker"] == "candidate")
                 }
+            )
             
-            # 6. Database Persistence
-            try:
-                ScoringService.save_scores(
-                    interview_id,
-                    scores["technical"],
-                    scores["communication"],
-                    scores["culture"],
-                    scores["overall"],
-                    summary["recommendation"],
-                    {"highlights": summary["highlights"], "concerns": summary["concerns"]}
-                )
-            except Exception as e:
-                print(f"[ERROR] Database save failed: {e}")
-            
-            # 7. Final status update
-            try:
-                SessionService.finish_interview(interview_id)
-            except Exception as e:
-                print(f"[ERROR] Status update failed: {e}")
+            # 6 + 7. Database Persistence and final status update
+            _report_progress(on_progress, "Saving results")
+            await self._persist_results(interview_id, scores, summary, calculated_signals)
+            self.state_store.pop(interview_id, None)
             
-            # 8. ATS Sync (Async-like)
-            try:
-                transcript = [{"turn": t["turn_no"], "speaker": t["speaker"], "text": t["text"]} for t in turns]
-                ATSSyncService.sync_to_ats(
+            # 8. ATS Sync (fire-and-forget so ATS latency doesn't delay the response;
+            # failures are logged by the background task)
+            _run_in_background(
+                asyncio.to_thread(
+                    ATSSyncService.sync_to_ats,
                     interview_id,
                     session["candidate_id"],
                     session["job_id"],
-                    transcript,
+                    [{"turn": t["turn_no"], "speaker": t["speaker"], "text": t["text"]} for t in turns],
                     scores if scores else {"technical":0, "communication":0, "culture":0, "overall":0},
                     summary["recommendation"],
                     summary
-                )
-            except Exception as e:
-                print(f"[WARN] ATS sync skipped/failed: {e}")
+                ),
+                f"ats_sync:{interview_id}"
+            )
             
             # Return final results
             return {
@@ -422,9 +573,7 @@ class InterviewController:
             
         except Exception as e:
             # ULTIMATE FALLBACK: Never return 500
-            print(f"[CRITICAL] finish_interview crashed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("finish_interview crashed: %s", e)
             return {
                 "interviewId": interview_id,
                 "recommendation": "HOLD",
@@ -435,16 +584,72 @@ class InterviewController:
                 "status": "COMPLETED"
             }
     
-    def get_report(self, interview_id: str) -> Dict[str, Any]:
+    async def _load_session_with_turns(self, interview_id: str):
+        """(session, turns) via one embedded query; two concurrent reads if embedding isn't available"""
+        try:
+            return await asyncio.to_thread(SessionService.get_session_with_turns, interview_id)
+        except Exception as e:
+            # e.g. no interview_turns -> interview_sessions foreign key for PostgREST to embed on
+            logger.warning("Embedded session+turns read failed, using separate reads: %s", e)
+            return await asyncio.gather(
+                asyncio.to_thread(SessionService.get_session, interview_id),
+                asyncio.to_thread(QuestionService.get_turns, interview_id)
+            )
+    
+    async def _guarded_step(self, name: str, step: Callable[[], Any], fallback: Any = None,
+                            level: int = logging.ERROR) -> Any:
+        """Run one finish_interview pipeline step; log and return the fallback on failure"""
+        try:
+            result = step()
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            logger.log(level, "%s failed: %s", name, e)
+            return fallback
+    
+    def _finish_response_from_scores(self, interview_id: str, stored_scores: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the finish_interview response from a persisted interview_scores row"""
+        reasoning = stored_scores.get("reasoning") or {}
+        scores = {
+            "technical": stored_scores.get("technical_score", 0),
+            "communication": stored_scores.get("communication_score", 0),
+            "culture": stored_scores.get("culture_score", 0),
+            "overall": stored_scores.get("overall_score", 0)
+        }
+        return {
+            "interviewId": interview_id,
+            "recommendation": stored_scores.get("recommendation", "HOLD"),
+            "overallScore": scores["overall"],
+            "scores": scores,
+            "highlights": reasoning.get("highlights", []),
+            "concerns": reasoning.get("concerns", []),
+            "status": "COMPLETED"
+        }
+    
+    async def get_report(self, interview_id: str) -> Dict[str, Any]:
         """Get full interview report"""
-        session = SessionService.get_session(interview_id)
+        # OPTIMIZATION: session + scores + signals come joined from the interview_report_v
+        # view (migration 004), fetched concurrently with the transcript
+        try:
+            session, turns = await asyncio.gather(
+                asyncio.to_thread(SessionService.get_report_row, interview_id),
+                asyncio.to_thread(QuestionService.get_turns, interview_id)
+            )
+            scores = session.get("scores") if session else None
+            signals = session.get("signals") if session else None
+        except Exception as e:
+            # View not deployed yet - read the tables separately
+            logger.warning("interview_report_v unavailable, falling back to per-table reads: %s", e)
+            session, turns, scores, signals = await asyncio.gather(
+                asyncio.to_thread(SessionService.get_session, interview_id),
+                asyncio.to_thread(QuestionService.get_turns, interview_id),
+                asyncio.to_thread(ScoringService.get_scores, interview_id),
+                asyncio.to_thread(SignalsService.get_signals, interview_id)
+            )
         if not session:
             raise ValueError(f"Interview {interview_id} not found")
         
-        turns = QuestionService.get_turns(interview_id)
-        scores = ScoringService.get_scores(interview_id)
-        signals = SignalsService.get_signals(interview_id)
-        
         transcript = [
             {
                 "turnNo": t["turn_no"],
@@ -466,78 +671,126 @@ class InterviewController:
             "summary": scores.get("reasoning", {}) if scores else {}
         }
     
+    async def _persist_results(self, interview_id: str, scores: Dict[str, Any], summary: Dict[str, Any],
+                               signals: Optional[Dict[str, Any]]) -> None:
+        """Save scores, signals and COMPLETED status - one atomic RPC, else the individual writes"""
+        reasoning = {"highlights": summary["highlights"], "concerns": summary["concerns"]}
+        
+        # OPTIMIZATION: one round trip / transaction instead of three writes
+        try:
+            await asyncio.to_thread(
+                SessionService.finish_interview_with_results,
+                interview_id,
+                {
+                    "scores": {k: scores[k] for k in ("technical", "communication", "culture", "overall")},
+                    "recommendation": summary["recommendation"],
+                    "reasoning": reasoning,
+                    "signals": signals
+                }
+            )
+            return
+        except Exception as e:
+            # e.g. migration 003 not applied yet
+            logger.warning("finish_interview RPC unavailable for %s, using individual writes: %s", interview_id, e)
+        
+        if signals is not None:
+            await self._guarded_step(
+                "Signals save",
+                lambda: asyncio.to_thread(SignalsService.save_signals, interview_id, signals)
+            )
+        await self._guarded_step("Database save", lambda: asyncio.to_thread(
+            ScoringService.save_scores,
+            interview_id,
+            scores["technical"],
+            scores["communication"],
+            scores["culture"],
+            scores["overall"],
+            summary["recommendation"],
+            reasoning
+        ))
+        await self._guarded_step(
+            "Status update",
+            lambda: asyncio.to_thread(SessionService.finish_interview, interview_id)
+        )
+    
     def _extract_qa_pairs(self, turns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract question-answer pairs from turns with turn numbers"""
-        qa_pairs = []
-        questions = {t["turn_no"]: t["text"] for t in turns if t["speaker"] == "agent"}
-        answers = {t["turn_no"]: t["text"] for t in turns if t["speaker"] == "candidate"}
+        # OPTIMIZATION: Single pass grouping by turn number (last turn per speaker wins)
+        field_by_speaker = {"agent": "question", "candidate": "answer"}
+        pairs: Dict[int, Dict[str, Any]] = {}
+        for t in turns:
+            field = field_by_speaker.get(t["speaker"])
+            if field is None:
+                continue  # system turns (disclosure, consent) are not Q&A
+            turn_no = t["turn_no"]
+            pair = pairs.get(turn_no)
+            if pair is None:
+                pair = pairs[turn_no] = {"turn_no": turn_no}
+            pair[field] = t["text"]
         
         # Match by turn number to ensure alignment
-        for turn_no in sorted(questions.keys()):
-            if turn_no in answers:
-                qa_pairs.append({
-                    "turn_no": turn_no,
-                    "question": questions[turn_no],
-                    "answer": answers[turn_no]
-                })
-        
-        return qa_pairs
+        return [
+            {"turn_no": turn_no, "question": pair["question"], "answer": pair["answer"]}
+            for turn_no, pair in sorted(pairs.items())
+            if "question" in pair and "answer" in pair
+        ]
     
-    def _evaluate_all_answers(self, turns: List[Dict[str, Any]], job_data: Dict[str, Any] = None, state: Optional[CandidateState] = None) -> List[Dict[str, Any]]:
-        """Evaluate all Q&A pairs in parallel to reduce latency"""
-        print(f"[DEBUG] Starting parallel evaluation of {len(turns)} turns")
-        qa_pairs = self._extract_qa_pairs(turns)
+    async def _evaluate_all_answers(self, qa_pairs: List[Dict[str, Any]], job_data: Dict[str, Any] = None, state: Optional[CandidateState] = None,
+                                    on_progress: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Evaluate pre-extracted Q&A pairs concurrently to reduce latency"""
+        logger.debug("Starting parallel evaluation of %d Q&A pairs", len(qa_pairs))
         
-        # Performance Choice: Use ThreadPoolExecutor for parallel API calls
-        MAX_WORKERS = 5
-        evaluations = []
+        # Performance Choice: asyncio.gather over the async LLM client,
+        # bounded by a process-wide semaphore to respect provider rate limits
+        semaphore = _get_eval_semaphore()
         
-        # Map turn numbers to types from the agent's plan
-        plan = self.agentic_interviewer.BASE_QUESTION_PLAN
+        # Map turn numbers to types from the agent's plan, built once per call
+        type_by_turn = {i: step["type"] for i, step in enumerate(self.agentic_interviewer.BASE_QUESTION_PLAN, start=1)}
+        # ACCURACY FIX: Use the actual types recorded in state during the interview
+        # This ensures extensions and special turns are correctly identified.
+        if state and hasattr(state, 'question_types'):
+            type_by_turn.update(enumerate(state.question_types, start=1))
         
-        def safe_evaluate(qa):
+        async def safe_evaluate(qa):
             try:
                 turn_no = qa.get("turn_no", 0)
-                # ACCURACY FIX: Use the actual types recorded in state during the interview
-                # This ensures extensions and special turns are correctly identified.
-                q_type = "technical"
-                if state and hasattr(state, 'question_types') and 1 <= turn_no <= len(state.question_types):
-                     q_type = state.question_types[turn_no - 1]
-                elif 1 <= turn_no <= len(plan):
-                    q_type = plan[turn_no - 1]["type"]
+                q_type = type_by_turn.get(turn_no, "technical")
                 
-                print(f"[DEBUG] Evaluating turn {turn_no} ({q_type})...")
+                logger.debug("Evaluating turn %s (%s)...", turn_no, q_type)
                 
                 # ACCURACY FIX: Use the original rubric if available in state
                 rubric = {"mustMention": [], "goodToMention": [], "redFlags": []}
                 if state and hasattr(state, 'question_rubrics') and turn_no in state.question_rubrics:
                     rubric = state.question_rubrics[turn_no]
-                    print(f"[DEBUG] Using persisted rubric for turn {turn_no}: {rubric.get('mustMention', [])}")
+                    logger.debug("Using persisted rubric for turn %s: %s", turn_no, rubric.get('mustMention', []))
 
                 # [REFINEMENT] Prepare answer with repetition warning if flagged
                 prepared_answer = qa["answer"]
                 if state and hasattr(state, 'repetitive_turns') and turn_no in state.repetitive_turns:
                     prepared_answer = f"[SYSTEM WARNING: REPETITIVE CONTENT DETECTED. The candidate has provided this exact or near-identical answer previously. Evaluate as Irrelevant/Repeated.]\n\n{prepared_answer}"
-                    print(f"[DEBUG] Prepending repetition warning to turn {turn_no}")
+                    logger.debug("Prepending repetition warning to turn %s", turn_no)
 
-                return self.evaluator_agent.evaluate_answer(
-                    qa["question"],
-                    prepared_answer,
-                    q_type,
-                    rubric,
-                    job_data
-                )
+                async with semaphore:
+                    result = await self.evaluator_agent.aevaluate_answer(
+                        qa["question"],
+                        prepared_answer,
+                        q_type,
+                        rubric,
+                        job_data
+                    )
+                _report_progress(on_progress, f"Scored answer {turn_no} of {len(qa_pairs)}")
+                return result
             except Exception as e:
-                print(f"[ERROR] Individual evaluation failed: {e}")
+                logger.error("Individual evaluation failed: %s", e)
+                _report_progress(on_progress, f"Answer {qa.get('turn_no', '?')} scored with fallback")
                 return {
                     "technical": 5, "communication": 5, "structure": 5, "confidence": 5,
                     "strengths": ["Evaluation failed - data saved"],
                     "improvements": ["Model timeout or rate limit reached"]
                 }
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            results = list(executor.map(safe_evaluate, qa_pairs))
-            evaluations.extend([r for r in results if r])
+        # safe_evaluate always returns a dict (fallback on error), so no filtering needed
+        evaluations = await asyncio.gather(*(safe_evaluate(qa) for qa in qa_pairs))
         
-        print(f"[DEBUG] Completed parallel evaluation. Got {len(evaluations)} results.")
+        logger.debug("Completed parallel evaluation. Got %d results.", len(evaluations))
         return evaluations
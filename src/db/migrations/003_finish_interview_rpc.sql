@@ -0,0 +1,73 @@
+-- Database Migration: Atomic finish_interview RPC
+-- Persists the final scores, signals and COMPLETED status in one round trip / transaction
+-- Version: 003
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- PHASE 1: Function
+-- ============================================================================
+
+-- payload shape (built by SessionService.finish_interview_with_results):
+-- {
+--   "scores":         {"technical": int, "communication": int, "culture": int, "overall": int},
+--   "recommendation": text,
+--   "reasoning":      {"highlights": [...], "concerns": [...]},
+--   "signals":        {"talk_ratio": num, "avg_response_length": int, "sentiment": text,
+--                      "speech_rate_wpm": int, "call_quality_score": int} | null
+-- }
+CREATE OR REPLACE FUNCTION finish_interview(iid VARCHAR, payload JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    finished_at TIMESTAMP := timezone('utc', now());
+BEGIN
+    INSERT INTO interview_scores (
+        interview_id, technical_score, communication_score, culture_score,
+        overall_score, recommendation, reasoning, created_at
+    ) VALUES (
+        iid,
+        (payload->'scores'->>'technical')::int,
+        (payload->'scores'->>'communication')::int,
+        (payload->'scores'->>'culture')::int,
+        (payload->'scores'->>'overall')::int,
+        payload->>'recommendation',
+        payload->'reasoning',
+        finished_at
+    );
+
+    -- Signals are omitted when their calculation failed (same as the per-call path)
+    IF jsonb_typeof(payload->'signals') = 'object' THEN
+        INSERT INTO interview_signals (
+            interview_id, talk_ratio, avg_response_length, sentiment,
+            speech_rate_wpm, call_quality_score, created_at
+        ) VALUES (
+            iid,
+            (payload->'signals'->>'talk_ratio')::numeric,
+            (payload->'signals'->>'avg_response_length')::int,
+            payload->'signals'->>'sentiment',
+            (payload->'signals'->>'speech_rate_wpm')::int,
+            (payload->'signals'->>'call_quality_score')::int,
+            finished_at
+        );
+    END IF;
+
+    UPDATE interview_sessions
+    SET status = 'COMPLETED', ended_at = finished_at
+    WHERE id = iid;
+END;
+$$;
+
+COMMENT ON FUNCTION finish_interview(VARCHAR, JSONB) IS 'Saves final scores, signals and COMPLETED status atomically';
+
+-- ============================================================================
+-- NOTES FOR ROLLBACK
+-- ============================================================================
+
+/*
+To rollback this migration:
+
+DROP FUNCTION IF EXISTS finish_interview(VARCHAR, JSONB);
+
+The app falls back to the individual inserts/update when the function is missing.
+*/
@@ -0,0 +1,41 @@
+-- Database Migration: Report aggregation view
+-- One row per interview with its scores and signals, so /report reads them in one query
+-- Version: 004
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- PHASE 1: View
+-- ============================================================================
+
+-- scores / signals are the full rows as JSON (NULL when not saved yet), matching
+-- what ScoringService.get_scores / SignalsService.get_signals return.
+-- Turns stay a separate query (unbounded).
+CREATE OR REPLACE VIEW interview_report_v AS
+SELECT
+    s.id AS interview_id,
+    s.candidate_id,
+    s.job_id,
+    s.status,
+    CASE WHEN sc.interview_id IS NULL THEN NULL ELSE to_jsonb(sc) END AS scores,
+    CASE WHEN sg.interview_id IS NULL THEN NULL ELSE to_jsonb(sg) END AS signals
+FROM interview_sessions s
+LEFT JOIN LATERAL (
+    SELECT * FROM interview_scores WHERE interview_id = s.id ORDER BY created_at LIMIT 1
+) sc ON TRUE
+LEFT JOIN LATERAL (
+    SELECT * FROM interview_signals WHERE interview_id = s.id ORDER BY created_at LIMIT 1
+) sg ON TRUE;
+
+COMMENT ON VIEW interview_report_v IS 'Session with its scores and signals for the report endpoint';
+
+-- ============================================================================
+-- NOTES FOR ROLLBACK
+-- ============================================================================
+
+/*
+To rollback this migration:
+
+DROP VIEW IF EXISTS interview_report_v;
+
+The app falls back to reading the tables separately when the view is missing.
+*/
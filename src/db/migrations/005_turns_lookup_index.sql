@@ -0,0 +1,36 @@
+-- Database Migration: interview_turns lookup index
+-- Serves the latest-turn, per-turn and transcript queries without sorting the table
+-- Version: 005
+-- Date: 2026-10-15
+
+-- ============================================================================
+-- PHASE 1: Add Indexes (CONCURRENT - No table locking)
+-- ============================================================================
+
+-- Covers (QuestionService):
+--   iter_turn_pages           WHERE interview_id = ? ORDER BY turn_no, timestamp (range pages;
+--                             index gives turn_no order, timestamp is an incremental sort of the
+--                             2-3 rows within each turn_no)
+--   get_turn_speakers         WHERE interview_id = ? AND turn_no = ?
+--   get_last_turn_number      WHERE interview_id = ? ORDER BY turn_no DESC LIMIT 1 (backward scan)
+--   get_turn                  WHERE interview_id = ? AND turn_no = ? AND speaker = ?
+--   get_candidate_answers     WHERE interview_id = ? AND speaker = 'candidate' AND turn_no < ?
+-- Not UNIQUE: a turn holds the agent question, the candidate answer and an optional
+-- follow-up, all sharing one turn_no.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_turns_interview_turn_speaker
+    ON interview_turns(interview_id, turn_no, speaker);
+
+-- check_active_interview (candidate_id + status) is already served by
+-- idx_interviews_candidate_status from migration 001.
+
+COMMENT ON INDEX idx_turns_interview_turn_speaker IS 'Ordered transcript and per-turn lookups by interview';
+
+-- ============================================================================
+-- NOTES FOR ROLLBACK
+-- ============================================================================
+
+/*
+To rollback this migration:
+
+DROP INDEX IF EXISTS idx_turns_interview_turn_speaker;
+*/
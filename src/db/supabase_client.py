@@ -1,5 +1,26 @@
 
+import httpx
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from src.config import SUPABASE_URL, SUPABASE_KEY
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+POSTGREST_TIMEOUT_S = 10
+
+def _build_options() -> ClientOptions:
+    """
+    OPTIMIZATION: one pooled (and, when h2 is installed, HTTP/2) httpx client for PostgREST,
+    so concurrent reads share keep-alive connections instead of re-handshaking.
+    Older supabase-py releases don't accept httpx_client; they keep their default client.
+    """
+    limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+    try:
+        http_client = httpx.Client(http2=True, limits=limits, timeout=POSTGREST_TIMEOUT_S)
+    except ImportError:  # h2 extra not installed
+        http_client = httpx.Client(limits=limits, timeout=POSTGREST_TIMEOUT_S)
+    try:
+        return ClientOptions(postgrest_client_timeout=POSTGREST_TIMEOUT_S, httpx_client=http_client)
+    except TypeError:
+        http_client.close()
+        return ClientOptions(postgrest_client_timeout=POSTGREST_TIMEOUT_S)
+
+supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY, options=_build_options())
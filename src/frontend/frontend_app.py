@@ -1,10 +1,50 @@
+import orjson
+import re
 import streamlit as st
 import requests
-import time
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
 
 # Configuration
 API_BASE_URL = "http://localhost:8080"
+# (connect, read) timeouts; finishing runs every LLM evaluation so it gets a longer read window
+HTTP_TIMEOUT = (3, 30)
+FINISH_TIMEOUT = (3, 120)
+# Candidate IDs: strict CAND-XXX (3 digits)
+_CAND_RE = re.compile(r'^CAND-\d{3}$')
+
+# Sidebar status badges
+_STATUS_COLOR = {
+    'NOT_STARTED': '🔴',
+    'CREATED': '🟡',
+    'DISCLOSURE_DONE': '🟡',
+    'CONSENT_GRANTED': '🟢',
+    'INTERVIEW_IN_PROGRESS': '🔵',
+    'COMPLETED': '✅',
+}
+
+# Question type badges
+_TYPE_EMOJI = {
+    'warmup': '👋',
+    'behavioral': '🎯',
+    'technical': '💻',
+    'motivation': '🚀',
+    'scenario': '🔍',
+    'culture': '🤝'
+}
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared keep-alive HTTP session, created once per server process (survives reruns)"""
+    session = requests.Session()
+    # Retry only idempotent methods (urllib3 default) so answers are never double-submitted,
+    # and never after a read timeout: /next-question generates and saves a turn server-side
+    retry = Retry(total=2, read=0, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 # Page config
 st.set_page_config(
@@ -14,209 +54,45 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS - Modern Professional Design
-st.markdown("""
-    <style>
-    /* Import Google Font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    .main {
-        padding: 1.5rem 2rem;
-        max-width: 1200px;
-        margin: 0 auto;
-    }
-    
-    /* Header Styles */
-    h1, h2, h3 {
-        color: #1a1a1a;
-        font-weight: 700;
-    }
-    
-    /* Button Styles */
-    .stButton>button {
-        width: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 0.75rem 1.5rem;
-        font-size: 1rem;
-        font-weight: 600;
-        border-radius: 12px;
-        border: none;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 6px rgba(102, 126, 234, 0.25);
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.35);
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-    }
-    
-    .stButton>button:active {
-        transform: translateY(0);
-    }
-    
-    /* Form Submit Button - Primary */
-    div[data-testid="stForm"] button[type="submit"] {
-        background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        box-shadow: 0 4px 6px rgba(17, 153, 142, 0.25);
-    }
-    
-    div[data-testid="stForm"] button[type="submit"]:hover {
-        background: linear-gradient(135deg, #38ef7d 0%, #11998e 100%);
-        box-shadow: 0 6px 12px rgba(17, 153, 142, 0.35);
-    }
-    
-    /* Card Boxes */
-    .success-box {
-        padding: 1.25rem;
-        border-radius: 12px;
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        border-left: 4px solid #28a745;
-        color: #155724;
-        margin: 1.5rem 0;
-        box-shadow: 0 2px 8px rgba(40, 167, 69, 0.1);
-    }
-    
-    .warning-box {
-        padding: 1.25rem;
-        border-radius: 12px;
-        background: linear-gradient(135deg, #fff3cd 0%, #ffeeba 100%);
-        border-left: 4px solid #ffc107;
-        color: #856404;
-        margin: 1.5rem 0;
-        box-shadow: 0 2px 8px rgba(255, 193, 7, 0.1);
-        font-size: 1.05rem;
-        line-height: 1.6;
-    }
-    
-    .info-box {
-        padding: 1.25rem;
-        border-radius: 12px;
-        background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
-        border-left: 4px solid #17a2b8;
-        color: #0c5460;
-        margin: 1.5rem 0;
-        box-shadow: 0 2px 8px rgba(23, 162, 184, 0.1);
-    }
-    
-    /* Question Card */
-    .question-card {
-        background: white;
-        padding: 2rem;
-        border-radius: 16px;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-        border: 1px solid #e0e0e0;
-        margin: 1.5rem 0;
-    }
-    
-    /* Progress Bar */
-    .progress-container {
-        background: #f0f0f0;
-        border-radius: 12px;
-        height: 10px;
-        margin: 1rem 0;
-        overflow: hidden;
-    }
-    
-    .progress-bar {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        height: 100%;
-        transition: width 0.3s ease;
-        border-radius: 12px;
-    }
-    
-    /* Recommendation Badges */
-    .recommendation-proceed {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 1.5rem;
-    }
-    
-    .recommendation-hold {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 1.5rem;
-    }
-    
-    .recommendation-reject {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 1.5rem;
-    }
-    
-    /* Text Area Styling */
-    .stTextArea textarea {
-        border-radius: 12px;
-        border: 2px solid #e0e0e0;
-        padding: 1rem;
-        font-size: 1rem;
-        transition: border-color 0.3s ease;
-    }
-    
-    .stTextArea textarea:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Metric Cards */
-    div[data-testid="stMetricValue"] {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #667eea;
-    }
-    
-    /* Hide Streamlit Branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    </style>
-""", unsafe_allow_html=True)
+# Custom CSS - Modern Professional Design (src/frontend/static/style.css)
+# Streamlit drops elements that aren't re-emitted, so the <style> tag is sent on
+# every rerun; the file read + minification happen once per process.
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    css = (Path(__file__).parent / "static" / "style.css").read_text(encoding="utf-8")
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)     # strip comments
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)      # drop whitespace around punctuation
+    return re.sub(r"\s+", " ", css).strip()
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # Initialize session state
-if 'interview_id' not in st.session_state:
-    st.session_state.interview_id = None
-if 'status' not in st.session_state:
-    st.session_state.status = 'NOT_STARTED'
-if 'turn_no' not in st.session_state:
-    st.session_state.turn_no = 0
-if 'qa_history' not in st.session_state:
-    st.session_state.qa_history = []
-if 'final_report' not in st.session_state:
-    st.session_state.final_report = None
-if 'selected_job' not in st.session_state:
-    st.session_state.selected_job = None
+# OPTIMIZATION: one setdefault pass instead of a contains/set round trip per key on the proxy.
+_SESSION_DEFAULTS = {
+    'interview_id': None,
+    'status': 'NOT_STARTED',
+    'turn_no': 0,
+    'final_report': None,
+    'selected_job': None,
+}
+for _key, _value in _SESSION_DEFAULTS.items():
+    st.session_state.setdefault(_key, _value)
 
 def create_interview(candidate_id, job_id):
     """Create a new interview"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/hr/interview/create",
             json={
                 "candidateId": candidate_id,
                 "jobId": job_id,
                 "channel": "simulation",
                 "consentRequired": True
-            }
+            },
+            timeout=HTTP_TIMEOUT
         )
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             st.error(f"Error: {response.status_code}")
             return None
@@ -224,15 +100,43 @@ def create_interview(candidate_id, job_id):
         st.error(f"Failed to connect to backend: {e}")
         return None
 
+class ApiError(Exception):
+    """Non-200 response from the backend (raised inside cached fetches so failures aren't cached)"""
+    def __init__(self, status_code, text):
+        super().__init__(f"{status_code} - {text}")
+        self.status_code = status_code
+
+class IncompleteReport(Exception):
+    """Report fetched before scoring finished; returned to the caller but not cached"""
+    def __init__(self, report):
+        super().__init__("report has no scores yet")
+        self.report = report
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_disclosure(interview_id):
+    response = get_http_session().get(f"{API_BASE_URL}/hr/interview/{interview_id}/disclosure", timeout=HTTP_TIMEOUT)
+    if response.status_code != 200:
+        raise ApiError(response.status_code, response.text)
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_report(interview_id):
+    response = get_http_session().get(f"{API_BASE_URL}/hr/interview/{interview_id}/report", timeout=HTTP_TIMEOUT)
+    if response.status_code != 200:
+        raise ApiError(response.status_code, response.text)
+    report = orjson.loads(response.content)
+    # Only a scored report is final/immutable
+    if not report.get("scores"):
+        raise IncompleteReport(report)
+    return report
+
 def get_disclosure(interview_id):
-    """Get disclosure text"""
+    """Get disclosure text (memoized per interview_id)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/hr/interview/{interview_id}/disclosure")
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Error fetching disclosure: {response.status_code} - {response.text}")
-            return None
+        return _fetch_disclosure(interview_id)
+    except ApiError as e:
+        st.error(f"Error fetching disclosure: {e}")
+        return None
     except Exception as e:
         st.error(f"Error: {e}")
         return None
@@ -240,12 +144,13 @@ def get_disclosure(interview_id):
 def submit_consent(interview_id, consent):
     """Submit consent"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/hr/interview/{interview_id}/consent",
-            json={"consent": consent}
+            json={"consent": consent},
+            timeout=HTTP_TIMEOUT
         )
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         return None
     except Exception as e:
         st.error(f"Error: {e}")
@@ -254,33 +159,59 @@ def submit_consent(interview_id, consent):
 def get_chat_history(interview_id):
     """Get full chat history"""
     try:
-        response = requests.get(f"{API_BASE_URL}/hr/interview/{interview_id}/turns")
+        response = get_http_session().get(f"{API_BASE_URL}/hr/interview/{interview_id}/turns", timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         return []
     except Exception:
         return []
 
-def get_next_question(interview_id):
-    """Get next question"""
+def get_interview_state(interview_id):
+    """
+    Get next question + recent turns + status in one call.
+    Sends the last ETag so a spurious rerun gets a 304 instead of a freshly generated question.
+    """
+    cached = st.session_state.get('state_payload')
+    headers = {}
+    if cached and st.session_state.get('question_etag'):
+        headers["If-None-Match"] = st.session_state.question_etag
     try:
-        response = requests.get(f"{API_BASE_URL}/hr/interview/{interview_id}/next-question")
+        response = get_http_session().get(
+            f"{API_BASE_URL}/hr/interview/{interview_id}/state",
+            headers=headers,
+            timeout=HTTP_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            return cached
         if response.status_code == 200:
-            return response.json()
+            payload = orjson.loads(response.content)
+            st.session_state.state_payload = payload
+            st.session_state.question_etag = response.headers.get("ETag")
+            return payload
         return None
     except Exception as e:
         st.error(f"Error: {e}")
         return None
 
-def submit_answer(interview_id, turn_no, answer):
-    """Submit answer"""
+def submit_answer(interview_id, turn_no, answer, include_next_question=True):
+    """Submit answer; by default the response also carries the next question"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/hr/interview/{interview_id}/answer",
-            json={"turnNo": turn_no, "answer": answer}
+            json={"turnNo": turn_no, "answer": answer, "includeNextQuestion": include_next_question},
+            timeout=HTTP_TIMEOUT
         )
         if response.status_code == 200:
-            return response.json()
+            result = orjson.loads(response.content)
+            if result.get("nextQuestion"):
+                # Same validator as /state, so a later conditional fetch can get a 304
+                st.session_state.state_payload = {
+                    "nextQuestion": result["nextQuestion"],
+                    "recentTurns": result.get("recentTurns") or [],
+                    "status": result.get("status")
+                }
+                st.session_state.question_etag = response.headers.get("ETag")
+            return result
         return None
     except Exception as e:
         st.error(f"Error: {e}")
@@ -289,20 +220,51 @@ def submit_answer(interview_id, turn_no, answer):
 def finish_interview(interview_id):
     """Finish interview"""
     try:
-        response = requests.post(f"{API_BASE_URL}/hr/interview/{interview_id}/finish")
+        response = get_http_session().post(f"{API_BASE_URL}/hr/interview/{interview_id}/finish", timeout=FINISH_TIMEOUT)
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         return None
     except Exception as e:
         st.error(f"Error: {e}")
         return None
 
+def stream_finish_interview(interview_id):
+    """
+    Finish interview via the SSE endpoint, yielding progress events as they arrive.
+    The last event is {"stage": "done", "report": {...}} on success.
+    """
+    try:
+        with get_http_session().post(
+            f"{API_BASE_URL}/hr/interview/{interview_id}/finish/stream",
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+            timeout=FINISH_TIMEOUT
+        ) as response:
+            if response.status_code != 200:
+                return
+            for line in response.iter_lines():
+                if line.startswith(b"data:"):
+                    yield orjson.loads(line[5:])
+    except Exception as e:
+        st.warning(f"Live progress unavailable: {e}")
+
+def finish_interview_with_progress(interview_id):
+    """Finish interview, writing each streamed stage into the current container; falls back to a plain POST"""
+    for event in stream_finish_interview(interview_id):
+        if event.get("stage") == "done":
+            return event.get("report")
+        if event.get("stage") == "error":
+            break
+        st.write(f"⏳ {event.get('stage')}")
+    return finish_interview(interview_id)
+
 def get_report(interview_id):
-    """Get full report"""
+    """Get full report (memoized per interview_id once scored)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/hr/interview/{interview_id}/report")
-        if response.status_code == 200:
-            return response.json()
+        return _fetch_report(interview_id)
+    except IncompleteReport as e:
+        return e.report
+    except ApiError:
         return None
     except Exception as e:
         st.error(f"Error: {e}")
@@ -333,16 +295,8 @@ def main():
             st.info(f"💼 **{st.session_state.selected_job}**")
             st.divider()
         
-        status_color = {
-            'NOT_STARTED': '🔴',
-            'CREATED': '🟡',
-            'DISCLOSURE_DONE': '🟡',
-            'CONSENT_GRANTED': '🟢',
-            'INTERVIEW_IN_PROGRESS': '🔵',
-            'COMPLETED': '✅',
-        }
         st.header("Interview Status")
-        st.markdown(f"### {status_color.get(st.session_state.status, '⚪')} {st.session_state.status}")
+        st.markdown(f"### {_STATUS_COLOR.get(st.session_state.status, '⚪')} {st.session_state.status}")
         
         if st.session_state.turn_no > 0:
             st.metric("Questions Asked", st.session_state.turn_no)
@@ -353,8 +307,11 @@ def main():
             st.session_state.interview_id = None
             st.session_state.status = 'NOT_STARTED'
             st.session_state.turn_no = 0
-            st.session_state.qa_history = []
             st.session_state.final_report = None
+            st.session_state.pop('full_report', None)
+            st.session_state.pop('closing_reply', None)
+            st.session_state.pop('state_payload', None)
+            st.session_state.pop('question_etag', None)
             st.rerun()
     
     # Main content
@@ -367,12 +324,9 @@ def main():
     elif st.session_state.status == 'COMPLETED':
         show_results()
 
-def show_start_screen():
-    """Show interview start screen"""
-    st.header("🎙️ Start New Interview")
-    
-    st.markdown("### Select Job Role")
-    
+@st.cache_resource
+def _job_tables():
+    """Static job catalog tables, built once per process (read-only, so shared without copying)"""
     # Define available jobs with display names
     job_options = {
         "JOB-DA-FRESHER": "📊 Data Analyst - Fresher (0-1 years)",
@@ -393,6 +347,101 @@ def show_start_screen():
         "JOB-FULLSTACK-EXPERIENCED": "🚀 Full Stack Engineer - Experienced (3-7 years)"
     }
     
+    job_details = {
+        "JOB-DA-FRESHER": {
+            "skills": "SQL, Excel, Data Visualization",
+            "focus": "Entry-level analytics, reporting, data cleaning"
+        },
+        "JOB-DA-MID": {
+            "skills": "Advanced SQL, Python/R, Tableau/Power BI, Statistics",
+            "focus": "Complex analytics, A/B testing, stakeholder presentations"
+        },
+        "JOB-DE-FRESHER": {
+            "skills": "SQL, Python, ETL/ELT, Database fundamentals",
+            "focus": "Pipeline development, data quality, basic automation"
+        },
+        "JOB-DE-SENIOR": {
+            "skills": "Python, Spark, Kafka, Cloud (AWS/GCP), Airflow, SQL optimization",
+            "focus": "Architecture, scalability, real-time processing, mentorship"
+        },
+        "JOB-DS-FRESHER": {
+            "skills": "Python, Statistics, ML basics, SQL, Visualization",
+            "focus": "Model building, EDA, A/B testing, presentations"
+        },
+        "JOB-DS-SENIOR": {
+            "skills": "Advanced ML, Deep Learning, MLOps, Causal Inference, Python",
+            "focus": "End-to-end ML, business impact, experimentation, leadership"
+        },
+        "JOB-ML-JUNIOR": {
+            "skills": "Python, ML frameworks, Docker, REST APIs, CI/CD",
+            "focus": "Model deployment, API development, monitoring"
+        },
+        "JOB-ML-SENIOR": {
+            "skills": "PyTorch/TF, Kubernetes, ML infrastructure, LLMs, Distributed systems",
+            "focus": "ML platform architecture, LLM integration, optimization, mentorship"
+        },
+        "JOB-DEVOPS-FRESHER": {
+            "skills": "Linux, Docker, K8s basics, Terraform, Jenkins",
+            "focus": "CI/CD, containerization, infra automation"
+        },
+        "JOB-DEVOPS-EXPERIENCED": {
+            "skills": "K8s, Terraform, AWS/GCP/Azure, CI/CD at scale, Monitoring",
+            "focus": "Scalability, SRE, Infrastructure security"
+        },
+        "JOB-BACKEND-FRESHER": {
+            "skills": "Python/Java, DSA, SQL, REST APIs, Git",
+            "focus": "API development, database interaction"
+        },
+        "JOB-BACKEND-EXPERIENCED": {
+            "skills": "Advanced Python/Java, System Design, SQL/NoSQL, Concurrency",
+            "focus": "Scalability, performance, mentorship"
+        },
+        "JOB-FRONTEND-FRESHER": {
+            "skills": "HTML, CSS, JS, React basics, Browser fundamentals",
+            "focus": "UI components, responsive design, UX"
+        },
+        "JOB-FRONTEND-EXPERIENCED": {
+            "skills": "React/Angular, TypeScript, State Management, Performance",
+            "focus": "UI architecture, performance, accessibility"
+        },
+        "JOB-FULLSTACK-FRESHER": {
+            "skills": "JS, React, Backend basics, SQL",
+            "focus": "End-to-end features, full-stack debugging"
+        },
+        "JOB-FULLSTACK-EXPERIENCED": {
+            "skills": "React, Backend frameworks, System Design, Docker",
+            "focus": "Full-stack ownership, system integration"
+        }
+    }
+    
+    # Reverse lookup for the selectbox (display name -> job_id)
+    display_to_job_id = {v: k for k, v in job_options.items()}
+    return job_options, job_details, display_to_job_id
+
+def _parse_max_q(progress_text: str) -> int:
+    """Upper bound of questions from a "N/min-max" progress string (15 if absent or malformed)"""
+    parts = progress_text.split('/', 1)[1].split('-') if '/' in progress_text else []
+    if len(parts) > 1 and parts[1].strip().isdigit() and int(parts[1]) > 0:
+        return int(parts[1])
+    return 15
+
+def render_interviewer_reply(container, text):
+    """Render the interviewer's answer to a candidate question"""
+    container.markdown(f"""
+    <div style="background-color: #f0f7ff; border-left: 5px solid #0066cc; padding: 15px; margin-bottom: 20px; border-radius: 4px;">
+        <strong>🤖 Interviewer Response:</strong><br>
+        {text}
+    </div>
+    """, unsafe_allow_html=True)
+
+def show_start_screen():
+    """Show interview start screen"""
+    st.header("🎙️ Start New Interview")
+    
+    st.markdown("### Select Job Role")
+    
+    job_options, job_details, display_to_job_id = _job_tables()
+    
     # Job role selection with better UX
     selected_job_display = st.selectbox(
         "Choose the position to interview for:",
@@ -401,77 +450,10 @@ def show_start_screen():
     )
     
     # Get the job_id from the selected display name
-    job_id = [k for k, v in job_options.items() if v == selected_job_display][0]
+    job_id = display_to_job_id[selected_job_display]
     
     # Show job details in an expander
     with st.expander("📋 View Job Details"):
-        job_details = {
-            "JOB-DA-FRESHER": {
-                "skills": "SQL, Excel, Data Visualization",
-                "focus": "Entry-level analytics, reporting, data cleaning"
-            },
-            "JOB-DA-MID": {
-                "skills": "Advanced SQL, Python/R, Tableau/Power BI, Statistics",
-                "focus": "Complex analytics, A/B testing, stakeholder presentations"
-            },
-            "JOB-DE-FRESHER": {
-                "skills": "SQL, Python, ETL/ELT, Database fundamentals",
-                "focus": "Pipeline development, data quality, basic automation"
-            },
-            "JOB-DE-SENIOR": {
-                "skills": "Python, Spark, Kafka, Cloud (AWS/GCP), Airflow, SQL optimization",
-                "focus": "Architecture, scalability, real-time processing, mentorship"
-            },
-            "JOB-DS-FRESHER": {
-                "skills": "Python, Statistics, ML basics, SQL, Visualization",
-                "focus": "Model building, EDA, A/B testing, presentations"
-            },
-            "JOB-DS-SENIOR": {
-                "skills": "Advanced ML, Deep Learning, MLOps, Causal Inference, Python",
-                "focus": "End-to-end ML, business impact, experimentation, leadership"
-            },
-            "JOB-ML-JUNIOR": {
-                "skills": "Python, ML frameworks, Docker, REST APIs, CI/CD",
-                "focus": "Model deployment, API development, monitoring"
-            },
-            "JOB-ML-SENIOR": {
-                "skills": "PyTorch/TF, Kubernetes, ML infrastructure, LLMs, Distributed systems",
-                "focus": "ML platform architecture, LLM integration, optimization, mentorship"
-            },
-            "JOB-DEVOPS-FRESHER": {
-                "skills": "Linux, Docker, K8s basics, Terraform, Jenkins",
-                "focus": "CI/CD, containerization, infra automation"
-            },
-            "JOB-DEVOPS-EXPERIENCED": {
-                "skills": "K8s, Terraform, AWS/GCP/Azure, CI/CD at scale, Monitoring",
-                "focus": "Scalability, SRE, Infrastructure security"
-            },
-            "JOB-BACKEND-FRESHER": {
-                "skills": "Python/Java, DSA, SQL, REST APIs, Git",
-                "focus": "API development, database interaction"
-            },
-            "JOB-BACKEND-EXPERIENCED": {
-                "skills": "Advanced Python/Java, System Design, SQL/NoSQL, Concurrency",
-                "focus": "Scalability, performance, mentorship"
-            },
-            "JOB-FRONTEND-FRESHER": {
-                "skills": "HTML, CSS, JS, React basics, Browser fundamentals",
-                "focus": "UI components, responsive design, UX"
-            },
-            "JOB-FRONTEND-EXPERIENCED": {
-                "skills": "React/Angular, TypeScript, State Management, Performance",
-                "focus": "UI architecture, performance, accessibility"
-            },
-            "JOB-FULLSTACK-FRESHER": {
-                "skills": "JS, React, Backend basics, SQL",
-                "focus": "End-to-end features, full-stack debugging"
-            },
-            "JOB-FULLSTACK-EXPERIENCED": {
-                "skills": "React, Backend frameworks, System Design, Docker",
-                "focus": "Full-stack ownership, system integration"
-            }
-        }
-        
         details = job_details.get(job_id, {})
         st.markdown(f"**Required Skills:** {details.get('skills', 'N/A')}")
         st.markdown(f"**Focus Areas:** {details.get('focus', 'N/A')}")
@@ -493,11 +475,9 @@ def show_start_screen():
     
     if st.button("🚀 Start Interview", type="primary", use_container_width=True):
         # Validate Candidate ID - strict format: CAND-XXX (3 digits)
-        import re
-        
         if not candidate_id or not candidate_id.strip():
             st.error("⚠️ Please enter a Candidate ID before starting the interview.")
-        elif not re.match(r'^CAND-\d{3}$', candidate_id.strip()):
+        elif not _CAND_RE.match(candidate_id.strip()):
             st.error("⚠️ Please enter a valid Candidate ID in format: CAND-XXX (e.g., CAND-001, CAND-123)")
         else:
             with st.spinner("Creating interview session..."):
@@ -506,8 +486,8 @@ def show_start_screen():
                     st.session_state.interview_id = result['interviewId']
                     st.session_state.status = 'CREATED'
                     st.session_state.selected_job = selected_job_display  # Store for display
-                    st.success(f"✅ Interview created: {result['interviewId']}")
-                    time.sleep(1)
+                    # Toast survives the rerun, so no need to block the worker with a sleep
+                    st.toast(f"Interview created: {result['interviewId']}", icon="✅")
                     st.rerun()
 
 def show_disclosure():
@@ -528,24 +508,33 @@ def show_disclosure():
         
         st.markdown("---")
         
-        col1, col2 = st.columns(2)
+        # Use form so the decision is a single submission
+        with st.form(key="consent_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                consent_yes = st.form_submit_button("✅ I Consent", type="primary", use_container_width=True)
+            
+            with col2:
+                consent_no = st.form_submit_button("❌ I Do Not Consent", use_container_width=True)
         
-        with col1:
-            if st.button("✅ I Consent", type="primary"):
-                result = submit_consent(st.session_state.interview_id, "yes")
-                if result and result['consentStatus'] == 'GRANTED':
-                    st.session_state.status = 'CONSENT_GRANTED'
-                    st.success("Consent granted! Starting interview...")
-                    time.sleep(1)
-                    st.rerun()
+        if consent_yes:
+            result = submit_consent(st.session_state.interview_id, "yes")
+            if result and result['consentStatus'] == 'GRANTED':
+                st.session_state.status = 'CONSENT_GRANTED'
+                st.toast("Consent granted! Starting interview...", icon="✅")
+                st.rerun()
         
-        with col2:
-            if st.button("❌ I Do Not Consent"):
-                result = submit_consent(st.session_state.interview_id, "no")
-                if result:
-                    st.warning("Interview ended due to consent denial.")
-                    st.session_state.status = 'NOT_STARTED'
+        if consent_no:
+            result = submit_consent(st.session_state.interview_id, "no")
+            if result:
+                st.warning("Interview ended due to consent denial.")
+                st.session_state.status = 'NOT_STARTED'
 
+# Fragment: widget interactions and form submits inside the Q&A panel rerun only
+# this function, not the header/sidebar/CSS. Every transition below changes state
+# the sidebar shows (turn count, status), so those reruns are app-scoped.
+@st.fragment
 def show_interview():
     """Show interview Q&A interface"""
     st.header("💬 Interview in Progress")
@@ -565,8 +554,11 @@ def show_interview():
     
     if should_fetch_question:
         with st.spinner("Generating question..."):
-            question = get_next_question(st.session_state.interview_id)
+            # One round trip: next question plus the turns leading up to it
+            interview_state = get_interview_state(st.session_state.interview_id)
+            question = interview_state["nextQuestion"] if interview_state else None
             if question:
+                st.session_state.recent_turns = interview_state.get("recentTurns", [])
                 st.session_state.current_question = question
                 st.session_state.status = 'INTERVIEW_IN_PROGRESS'
                 st.session_state.show_next = False
@@ -582,7 +574,7 @@ def show_interview():
             
             with st.status("Finalizing Interview & Generating Report...", expanded=True) as status:
                 st.write("🔄 Analyzing and scoring responses in parallel...")
-                finish_result = finish_interview(st.session_state.interview_id)
+                finish_result = finish_interview_with_progress(st.session_state.interview_id)
                 
                 if finish_result:
                     st.write("📊 Compiling insights and recommendations...")
@@ -593,8 +585,7 @@ def show_interview():
                     
                     st.write("🚀 Synchronizing results...")
                     status.update(label="✅ All Done! Redirecting...", state="complete", expanded=False)
-                    time.sleep(1)
-                    st.rerun()
+                    st.rerun(scope="app")
                 else:
                     status.update(label="❌ Report generation failed", state="error")
             return
@@ -605,38 +596,14 @@ def show_interview():
             current_num = st.session_state.turn_no
             st.markdown(f"**Progress:** Question {current_num} {progress_text}")
             # Calculate progress percentage
-            try:
-                parts = str(progress_text).split('/')[1].split('-')
-                max_q = int(parts[1]) if len(parts) > 1 else 15
-                progress = min(100, (current_num / max_q) * 100)
-                st.markdown(f'<div class="progress-container"><div class="progress-bar" style="width: {progress}%"></div></div>', unsafe_allow_html=True)
-            except:
-                pass
+            max_q = _parse_max_q(str(progress_text))
+            progress = min(100, (current_num / max_q) * 100)
+            st.markdown(f'<div class="progress-container"><div class="progress-bar" style="width: {progress}%"></div></div>', unsafe_allow_html=True)
         
         # Auto-finish interview after wrapup question (Q10) - FALLBACK for non-agentic mode
         if q.get('questionType') == 'wrapup':
-            # CHECK: Did agent respond to candidate's previous question?
-            # Fetch history to find out
-            history = get_chat_history(st.session_state.interview_id)
-            if history:
-                # Look for the last agent turn that isn't this wrapup question
-                # Specifically, look for Turn 9 (candidate_questions) Agent Response
-                prev_turn_no = q.get('turnNo', 10) - 1
-                agent_responses = [
-                    t for t in history 
-                    if t['speaker'] == 'agent' 
-                    and t.get('turn_no') == prev_turn_no
-                    and "Do you have any questions" not in t.get('text', '')
-                ]
-                
-                if agent_responses:
-                    last_response = agent_responses[-1]['text']
-                    st.markdown(f"""
-                    <div style="background-color: #f0f7ff; border-left: 5px solid #0066cc; padding: 15px; margin-bottom: 20px; border-radius: 4px;">
-                        <strong>🤖 Interviewer Response:</strong><br>
-                        {last_response}
-                    </div>
-                    """, unsafe_allow_html=True)
+            # Filled in once history arrives (fetched inside the status block below)
+            agent_response_slot = st.empty()
             
             # UI FIX: Show as completion message, not a question
             st.markdown('<div class="success-box"><strong>🎉 Interview Complete!</strong></div>', unsafe_allow_html=True)
@@ -645,8 +612,28 @@ def show_interview():
             
             with st.status("Completing Interview...", expanded=True) as status:
                 st.write("🔄 Finalizing evaluations...")
-                finish_result = finish_interview(st.session_state.interview_id)
+                # Recent turns arrived with the question; fall back to a history fetch.
+                # Shown first so the interviewer's reply is visible while scoring streams in
+                history = st.session_state.get('recent_turns') or get_chat_history(st.session_state.interview_id)
+                
+                # CHECK: Did agent respond to candidate's previous question?
+                if history:
+                    # Look for the last agent turn that isn't this wrapup question
+                    # Specifically, look for Turn 9 (candidate_questions) Agent Response
+                    prev_turn_no = q.get('turnNo', 10) - 1
+                    agent_responses = [
+                        t for t in history 
+                        if t['speaker'] == 'agent' 
+                        and t.get('turn_no') == prev_turn_no
+                        and "Do you have any questions" not in t.get('text', '')
+                    ]
+                    
+                    if agent_responses:
+                        # Kept in session so the results page can keep showing it
+                        st.session_state.closing_reply = agent_responses[-1]['text']
+                        render_interviewer_reply(agent_response_slot, st.session_state.closing_reply)
                 
+                finish_result = finish_interview_with_progress(st.session_state.interview_id)
                 if finish_result:
                     st.write("✨ Generating final analysis...")
                     st.session_state.final_report = finish_result
@@ -655,8 +642,8 @@ def show_interview():
                     del st.session_state.current_question
                     
                     status.update(label="✅ Success! Redirecting...", state="complete", expanded=False)
-                    time.sleep(3)  # Give user time to read the response!
-                    st.rerun()
+                    # The interviewer's reply stays visible on the results page, so redirect immediately
+                    st.rerun(scope="app")
                 else:
                     status.update(label="❌ Error generating report", state="error")
             return  # Exit early, don't show answer input for wrapup
@@ -667,15 +654,7 @@ def show_interview():
             st.caption("💡 You can ask about the role, team, company culture, or say 'No questions' to proceed.")
         else:
             # Question type badge
-            type_emoji = {
-                'warmup': '👋',
-                'behavioral': '🎯',
-                'technical': '💻',
-                'motivation': '🚀',
-                'scenario': '🔍',
-                'culture': '🤝'
-            }
-            emoji = type_emoji.get(q['questionType'], '❓')
+            emoji = _TYPE_EMOJI.get(q['questionType'], '❓')
             st.markdown(f'<div class="warning-box"><strong>{emoji} Question {q["turnNo"]} ({q["questionType"].title()}):</strong><br><br>{q["question"]}</div>', unsafe_allow_html=True)
         
         st.markdown("---")
@@ -706,20 +685,23 @@ def show_interview():
         # Handle submit answer
         if submit_clicked:
             if answer and answer.strip():  # Validate after click
-                with st.spinner("Submitting answer..."):
+                with st.spinner("Submitting answer and preparing next question..."):
                     result = submit_answer(st.session_state.interview_id, q["turnNo"], answer)
                     if result:
-                        st.session_state.qa_history.append({
-                            'question': q['question'],
-                            'answer': answer,
-                            'type': q['questionType']
-                        })
                         st.session_state.turn_no = q["turnNo"]
-                        st.session_state.show_next = True
-                        del st.session_state.current_question
-                        st.success("Answer submitted successfully!")
-                        time.sleep(0.5)
-                        st.rerun()
+                        next_question = result.get("nextQuestion")
+                        if next_question:
+                            # Next question came back with the answer - no separate fetch needed
+                            st.session_state.current_question = next_question
+                            st.session_state.recent_turns = result.get("recentTurns") or []
+                            st.session_state.status = 'INTERVIEW_IN_PROGRESS'
+                            st.session_state.show_next = False
+                            st.session_state.last_fetched_turn = next_question.get('turnNo', q["turnNo"] + 1)
+                        else:
+                            st.session_state.show_next = True
+                            del st.session_state.current_question
+                        st.toast("Answer submitted successfully!", icon="✅")
+                        st.rerun(scope="app")
             else:
                 st.warning("Please enter an answer before submitting.")
         
@@ -730,18 +712,24 @@ def show_interview():
                 if report:
                     st.session_state.final_report = report
                     st.session_state.status = 'COMPLETED'
-                    st.success("Interview completed!")
-                    time.sleep(1)
-                    st.rerun()
+                    st.toast("Interview completed!", icon="✅")
+                    st.rerun(scope="app")
 
 def show_results():
     """Show interview results"""
     st.header("📊 Interview Results")
     
-    # Get report from session state or fetch from API
-    if not st.session_state.final_report:
+    if st.session_state.get('closing_reply'):
+        render_interviewer_reply(st, st.session_state.closing_reply)
+    
+    # Fetch the full report once per session; it backs both the summary
+    # (when /finish didn't run in this session) and the "View Full Report" button
+    if 'full_report' not in st.session_state:
         with st.spinner("Loading interview results..."):
-            st.session_state.final_report = get_report(st.session_state.interview_id)
+            st.session_state.full_report = get_report(st.session_state.interview_id)
+    
+    if not st.session_state.final_report:
+        st.session_state.final_report = st.session_state.full_report
     
     if st.session_state.final_report:
         report = st.session_state.final_report
@@ -793,9 +781,8 @@ def show_results():
         
         # Full Report
         if st.button("📄 View Full Report"):
-            full_report = get_report(st.session_state.interview_id)
-            if full_report:
-                st.json(full_report)
+            if st.session_state.full_report:
+                st.json(st.session_state.full_report)
     else:
         st.error("❌ Could not load interview results. Please try refreshing the page.")
 
@@ -1,4 +1,9 @@
 import os
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -6,10 +11,27 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(dotenv_path=env_path, override=True)
 
-from fastapi import FastAPI
+# Non-blocking logging: handlers hand records to a queue, and a listener
+# thread does the actual stdout I/O off the request path
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+    force=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 # Now safe to import internal routes that depend on config
 from src.routes.interview_routes import router as interview_router, ats_router
+from src.services.session_service import begin_request_cache, end_request_cache
+from src.services.ats_sync_service import ATSSyncService, SYNC_LOG_FLUSH_INTERVAL_S
 import uvicorn
 
 # Initialize FastAPI app
@@ -28,6 +50,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request session cache so repeated get_session calls hit the DB once
+@app.middleware("http")
+async def request_session_cache(request: Request, call_next):
+    token = begin_request_cache()
+    try:
+        return await call_next(request)
+    finally:
+        end_request_cache(token)
+
+# Background flusher for batched ATS sync logs
+async def _flush_ats_sync_logs_periodically():
+    while True:
+        await asyncio.sleep(SYNC_LOG_FLUSH_INTERVAL_S)
+        try:
+            await asyncio.to_thread(ATSSyncService.flush_sync_logs)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to flush ATS sync logs")
+
+@app.on_event("startup")
+async def start_ats_log_flusher():
+    app.state.ats_log_flusher = asyncio.create_task(_flush_ats_sync_logs_periodically())
+
+@app.on_event("shutdown")
+async def stop_ats_log_flusher():
+    app.state.ats_log_flusher.cancel()
+    try:
+        await asyncio.to_thread(ATSSyncService.flush_sync_logs)
+    except Exception:
+        logging.getLogger(__name__).exception("Failed to flush ATS sync logs on shutdown")
+
+# Shared error mapping for the routers: lookups raise ValueError for unknown interviews
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
 # Include routers
 app.include_router(interview_router)
 app.include_router(ats_router)
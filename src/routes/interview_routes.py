@@ -1,4 +1,8 @@
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+import orjson
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from src.controllers.interview_controller import InterviewController
 from src.schemas.interview_schema import (
     CreateInterviewRequest,
@@ -7,6 +11,7 @@ from src.schemas.interview_schema import (
     ConsentRequest,
     ConsentResponse,
     NextQuestionResponse,
+    InterviewStateResponse,
     AnswerRequest,
     AnswerResponse,
     FinishInterviewResponse
@@ -19,95 +24,137 @@ controller = InterviewController()
 async def create_interview(request: CreateInterviewRequest):
     """Create a new interview session"""
     try:
-        result = controller.create_interview(
+        result = await controller.create_interview(
             request.candidateId,
             request.jobId,
             request.channel,
             request.consentRequired
         )
-        return result
-    except Exception as e:
+    except ValueError as e:
+        # An active-interview conflict isn't a missing resource - keep it out of the global 404 mapping
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return result
 
 @router.get("/{interview_id}/disclosure", response_model=DisclosureResponse)
 async def get_disclosure(interview_id: str):
     """Get disclosure script and request consent"""
-    try:
-        result = controller.get_disclosure(interview_id)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await controller.get_disclosure(interview_id)
+    return result
 
 @router.post("/{interview_id}/consent", response_model=ConsentResponse)
 async def submit_consent(interview_id: str, request: ConsentRequest):
     """Submit consent response"""
-    try:
-        result = controller.submit_consent(interview_id, request.consent)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await controller.submit_consent(interview_id, request.consent)
+    return result
+
+async def _not_modified(interview_id: str, if_none_match: Optional[str]) -> Optional[Response]:
+    """304 response if the client already holds the current, still-unanswered question"""
+    if not if_none_match:
+        return None
+    etag = await controller.get_pending_question_etag(interview_id)
+    if etag and if_none_match.strip('"') == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": f'"{etag}"'})
+    return None
+
+def _set_question_etag(response: Response, interview_id: str, question: dict):
+    if not question.get("final"):
+        response.headers["ETag"] = f'"{controller.question_etag(interview_id, question["turnNo"])}"'
 
 @router.get("/{interview_id}/next-question", response_model=NextQuestionResponse)
-async def get_next_question(interview_id: str):
-    """Get next interview question"""
-    try:
-        result = controller.get_next_question(interview_id)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+async def get_next_question(interview_id: str, response: Response,
+                            if_none_match: Optional[str] = Header(None)):
+    """Get next interview question (supports If-None-Match for the pending question)"""
+    not_modified = await _not_modified(interview_id, if_none_match)
+    if not_modified:
+        return not_modified
+    result = await controller.get_next_question(interview_id)
+    _set_question_etag(response, interview_id, result)
+    return result
+
+@router.get("/{interview_id}/state", response_model=InterviewStateResponse)
+async def get_interview_state(interview_id: str, response: Response,
+                              if_none_match: Optional[str] = Header(None)):
+    """Get next question together with recent turns and status (one round trip for the UI)"""
+    not_modified = await _not_modified(interview_id, if_none_match)
+    if not_modified:
+        return not_modified
+    result = await controller.get_interview_state(interview_id)
+    _set_question_etag(response, interview_id, result["nextQuestion"])
+    return result
 
 @router.post("/{interview_id}/answer", response_model=AnswerResponse)
-async def submit_answer(interview_id: str, request: AnswerRequest):
+async def submit_answer(interview_id: str, request: AnswerRequest, response: Response):
     """Submit candidate answer"""
-    try:
-        result = controller.submit_answer(interview_id, request.turnNo, request.answer)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await controller.submit_answer(
+        interview_id,
+        request.turnNo,
+        request.answer,
+        include_next_question=request.includeNextQuestion
+    )
+    if result.get("nextQuestion"):
+        _set_question_etag(response, interview_id, result["nextQuestion"])
+    return result
 
 @router.post("/{interview_id}/finish", response_model=FinishInterviewResponse)
 async def finish_interview(interview_id: str):
     """Finish interview and generate report"""
-    try:
-        result = controller.finish_interview(interview_id)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await controller.finish_interview(interview_id)
+    return result
+
+@router.post("/{interview_id}/finish/stream")
+async def finish_interview_stream(interview_id: str):
+    """
+    Finish interview, streaming progress as Server-Sent Events.
+    Emits {"stage": ...} events while scoring, then a final {"stage": "done", "report": {...}}.
+    """
+    events: asyncio.Queue = asyncio.Queue()
+    
+    async def event_stream():
+        task = asyncio.create_task(
+            controller.finish_interview(interview_id, on_progress=lambda stage: events.put_nowait({"stage": stage}))
+        )
+        task.add_done_callback(lambda _t: events.put_nowait(None))
+        
+        while (event := await events.get()) is not None:
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+        
+        try:
+            report = FinishInterviewResponse.model_validate(task.result()).model_dump()
+            final_event = {"stage": "done", "report": report}
+        except Exception as e:
+            final_event = {"stage": "error", "detail": str(e)}
+        yield b"data: " + orjson.dumps(final_event) + b"\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.get("/{interview_id}/report")
 async def get_report(interview_id: str):
     """Get full interview report"""
-    try:
-        result = controller.get_report(interview_id)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
-
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    result = await controller.get_report(interview_id)
+    return result
 
 @router.get("/{interview_id}/turns")
 async def get_turns(interview_id: str):
     """Get full interview conversation history"""
-    try:
-        result = controller.get_turns(interview_id)
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    # OPTIMIZATION: stream the JSON array page by page instead of building the whole transcript
+    pages = controller.iter_turn_pages(interview_id)
+    # First page read up front so a failed read is still a 500, not a truncated 200
+    first_page = await anext(pages, None)
+    
+    async def body():
+        yield b"["
+        page, separator = first_page, b""
+        while page is not None:
+            yield separator + orjson.dumps(page)[1:-1]
+            separator = b","
+            page = await anext(pages, None)
+        yield b"]"
+    
+    return StreamingResponse(body(), media_type="application/json")
 
 # Mock ATS Webhook
 ats_router = APIRouter(prefix="/mock-ats", tags=["Mock ATS"])
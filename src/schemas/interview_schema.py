@@ -33,14 +33,22 @@ class NextQuestionResponse(BaseModel):
     question: str
     expectedSignals: List[str]
 
+class InterviewStateResponse(BaseModel):
+    nextQuestion: Dict[str, Any]
+    recentTurns: List[Dict[str, Any]]
+    status: str
+
 class AnswerRequest(BaseModel):
     turnNo: int
     answer: str
+    includeNextQuestion: bool = False
 
 class AnswerResponse(BaseModel):
     received: bool
     status: str
     nextStep: str
+    nextQuestion: Optional[Dict[str, Any]] = None
+    recentTurns: Optional[List[Dict[str, Any]]] = None
 
 class InterviewScores(BaseModel):
     technical: int
@@ -1,8 +1,29 @@
+import hashlib
+import logging
+import threading
 import requests
-from datetime import datetime
-from typing import Dict, Any
+import orjson
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timezone
+from typing import Dict, Any, List
 from src.db.supabase_client import supabase
 
+logger = logging.getLogger(__name__)
+
+# OPTIMIZATION: pooled keep-alive session - reuses the TCP connection across syncs
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# OPTIMIZATION: sync logs are buffered and written in batches (flushed by size here,
+# and periodically by the app's background flusher) instead of one insert per sync
+SYNC_LOG_BATCH_SIZE = 50
+SYNC_LOG_FLUSH_INTERVAL_S = 5.0
+# Rows kept while the database is unreachable; the oldest are dropped beyond this
+SYNC_LOG_MAX_PENDING = 1000
+_pending_logs: List[Dict[str, Any]] = []
+_pending_logs_lock = threading.Lock()
+
 class ATSSyncService:
     """Handles synchronization with ATS (mock)"""
     
@@ -25,35 +46,75 @@ class ATSSyncService:
             },
             "recommendation": recommendation,
             "summary": summary,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
+        success = False
         try:
             # Call mock ATS endpoint
-            response = requests.post(
+            # OPTIMIZATION: orjson serializes the transcript-heavy payload much faster than stdlib json
+            response = _session.post(
                 "http://localhost:8080/mock-ats/webhook",
-                json=payload,
+                data=orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+                headers={"Content-Type": "application/json"},
                 timeout=5
             )
             
             success = response.status_code == 200
-            
-            # Log sync attempt
-            ATSSyncService._log_sync(interview_id, payload, "success" if success else "fail")
-            
-            return success
-            
         except Exception as e:
-            ATSSyncService._log_sync(interview_id, payload, "fail")
-            return False
+            logger.warning("ATS sync failed for %s: %s", interview_id, e)
+        
+        # Log sync attempt (outside the try so a logging problem can't re-label a sync)
+        ATSSyncService._log_sync(interview_id, payload, "success" if success else "fail")
+        
+        return success
     
     @staticmethod
     def _log_sync(interview_id: str, payload: Dict[str, Any], status: str):
-        """Log ATS sync attempt"""
+        """Queue an ATS sync log row; writes once a full batch is pending"""
+        # OPTIMIZATION: the transcript already lives in interview_turns - log only its size
+        # and a digest of what was sent, so a long interview doesn't bloat every log row
+        transcript = payload.get("transcript") or []
+        log_payload = {k: v for k, v in payload.items() if k != "transcript"}
+        log_payload["transcript_turns"] = len(transcript)
+        log_payload["transcript_sha256"] = hashlib.sha256(
+            orjson.dumps(transcript, option=orjson.OPT_NON_STR_KEYS)
+        ).hexdigest()
         data = {
             "interview_id": interview_id,
-            "payload": payload,
+            "payload": log_payload,
             "status": status,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
-        supabase.table("ats_sync_logs").insert(data).execute()
+        with _pending_logs_lock:
+            _pending_logs.append(data)
+            batch_full = len(_pending_logs) >= SYNC_LOG_BATCH_SIZE
+        if batch_full:
+            ATSSyncService.flush_sync_logs()
+    
+    @staticmethod
+    def flush_sync_logs() -> int:
+        """
+        Write all pending sync logs in one multi-row insert; returns the number written.
+        A failed write is logged, not raised - the rows are kept for the next flush.
+        """
+        with _pending_logs_lock:
+            if not _pending_logs:
+                return 0
+            batch = _pending_logs[:]
+            _pending_logs.clear()
+        try:
+            supabase.table("ats_sync_logs").insert(batch).execute()
+        except Exception as e:
+            # Put the rows back so the next flush retries them, dropping the oldest
+            # past SYNC_LOG_MAX_PENDING so a long outage can't grow the buffer forever
+            with _pending_logs_lock:
+                _pending_logs[:0] = batch
+                dropped = len(_pending_logs) - SYNC_LOG_MAX_PENDING
+                if dropped > 0:
+                    del _pending_logs[:dropped]
+            logger.error("Failed to write %d ATS sync logs: %s", len(batch), e)
+            if dropped > 0:
+                logger.warning("Dropped %d oldest pending ATS sync logs", dropped)
+            return 0
+        return len(batch)
@@ -3,8 +3,9 @@ Job Service
 Handles loading and managing job descriptions for dynamic interview generation
 """
 
-import json
 import os
+import orjson
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 
 class JobService:
@@ -13,23 +14,47 @@ class JobService:
     def __init__(self):
         self.jobs_cache = None
         self.jobs_file_path = os.path.join(os.path.dirname(__file__), '..', '..', 'job_descriptions.json')
+        self._mtime = None
+        self._by_title: Dict[str, List[Dict[str, Any]]] = {}
+        self._levels_lower: List[tuple] = []
+    
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.jobs_file_path).st_mtime
+        except OSError:
+            return None
     
     def load_jobs(self) -> Dict[str, Any]:
-        """Load job descriptions from JSON file"""
-        if self.jobs_cache is not None:
+        """Load job descriptions from JSON file (reloaded when the file's mtime changes)"""
+        mtime = self._file_mtime()
+        if self.jobs_cache is not None and mtime == self._mtime:
             return self.jobs_cache
         
+        self._mtime = mtime
         try:
-            with open(self.jobs_file_path, 'r') as f:
-                data = json.load(f)
-                self.jobs_cache = data.get('jobs', {})
+            # OPTIMIZATION: orjson parses the catalog bytes several times faster than json.load
+            with open(self.jobs_file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+                self._set_jobs(data.get('jobs', {}))
                 return self.jobs_cache
         except FileNotFoundError:
             print(f"Warning: job_descriptions.json not found at {self.jobs_file_path}")
-            return self._get_fallback_jobs()
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Error parsing job_descriptions.json: {e}")
-            return self._get_fallback_jobs()
+        
+        # OPTIMIZATION: Cache the fallback too, so a missing/broken file
+        # doesn't cost a failed open + log line on every get_job call
+        self._set_jobs(self._get_fallback_jobs())
+        return self.jobs_cache
+    
+    def _set_jobs(self, jobs: Dict[str, Any]) -> None:
+        """Store the catalog and build the lowercase lookup indexes once per load"""
+        by_title = defaultdict(list)
+        for job in jobs.values():
+            by_title[job.get('title', '').lower()].append(job)
+        self._by_title = dict(by_title)
+        self._levels_lower = [(job.get('level', '').lower(), job) for job in jobs.values()]
+        self.jobs_cache = jobs
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -54,8 +79,8 @@ class JobService:
         Returns:
             List of matching job descriptions
         """
-        jobs = self.load_jobs()
-        return [job for job in jobs.values() if job.get('title', '').lower() == title.lower()]
+        self.load_jobs()
+        return list(self._by_title.get(title.lower(), []))
     
     def get_jobs_by_level(self, level: str) -> List[Dict[str, Any]]:
         """
@@ -67,8 +92,10 @@ class JobService:
         Returns:
             List of matching job descriptions
         """
-        jobs = self.load_jobs()
-        return [job for job in jobs.values() if level.lower() in job.get('level', '').lower()]
+        self.load_jobs()
+        # Substring match, so scan the pre-lowercased levels rather than an exact-key index
+        level = level.lower()
+        return [job for job_level, job in self._levels_lower if level in job_level]
     
     def list_all_jobs(self) -> Dict[str, str]:
         """
@@ -139,6 +166,8 @@ class JobService:
 
 # Global instance
 job_service = JobService()
+# Parse the catalog at import so the first request doesn't pay for it
+job_service.load_jobs()
 
 
 # Convenience functions
@@ -1,7 +1,10 @@
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional
 from src.db.supabase_client import supabase
 
+# Rows per PostgREST request when reading transcripts
+TURNS_PAGE_SIZE = 500
+
 class QuestionService:
     """Handles interview turns (questions and answers)"""
     
@@ -13,15 +16,85 @@ class QuestionService:
             "turn_no": turn_no,
             "speaker": speaker,
             "text": text,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         supabase.table("interview_turns").insert(data).execute()
     
+    @staticmethod
+    def iter_turn_pages(interview_id: str, page_size: int = TURNS_PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield an interview's turns one non-empty page (range request) at a time.
+        Bounds per-request payloads and isn't cut off by PostgREST's max-rows limit.
+        """
+        offset = 0
+        while True:
+            response = (
+                supabase.table("interview_turns")
+                .select("*")
+                .eq("interview_id", interview_id)
+                .order("turn_no")
+                .order("timestamp")  # tie-break so pages don't overlap within a turn_no
+                .range(offset, offset + page_size - 1)
+                .execute()
+            )
+            rows = response.data or []
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            offset += page_size
+    
+    @staticmethod
+    def iter_turns(interview_id: str, page_size: int = TURNS_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield all turns for an interview (ordered by turn_no, then timestamp)"""
+        for page in QuestionService.iter_turn_pages(interview_id, page_size):
+            yield from page
+    
     @staticmethod
     def get_turns(interview_id: str) -> List[Dict[str, Any]]:
         """Get all turns for an interview"""
-        response = supabase.table("interview_turns").select("*").eq("interview_id", interview_id).order("turn_no").execute()
-        return response.data if response.data else []
+        return list(QuestionService.iter_turns(interview_id))
+    
+    @staticmethod
+    def get_turn(interview_id: str, turn_no: int, speaker: str = "agent") -> Optional[Dict[str, Any]]:
+        """Get the first turn for a given turn number and speaker"""
+        response = (
+            supabase.table("interview_turns")
+            .select("turn_no, speaker, text")
+            .eq("interview_id", interview_id)
+            .eq("turn_no", turn_no)
+            .eq("speaker", speaker)
+            .order("timestamp")
+            .limit(1)
+            .execute()
+        )
+        return response.data[0] if response.data else None
+    
+    @staticmethod
+    def get_candidate_answers(interview_id: str, before_turn_no: int) -> List[str]:
+        """Get candidate answer texts for turns before the given turn number"""
+        response = (
+            supabase.table("interview_turns")
+            .select("text")
+            .eq("interview_id", interview_id)
+            .eq("speaker", "candidate")
+            .lt("turn_no", before_turn_no)
+            .order("turn_no")
+            .execute()
+        )
+        return [row["text"] for row in response.data] if response.data else []
+    
+    @staticmethod
+    def get_turn_speakers(interview_id: str, turn_no: int) -> set:
+        """Speakers with a row at the given turn"""
+        response = (
+            supabase.table("interview_turns")
+            .select("speaker")
+            .eq("interview_id", interview_id)
+            .eq("turn_no", turn_no)
+            .execute()
+        )
+        return {r["speaker"] for r in response.data or []}
     
     @staticmethod
     def get_last_turn_number(interview_id: str) -> int:
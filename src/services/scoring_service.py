@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from src.db.supabase_client import supabase
 
 class ScoringService:
@@ -16,7 +16,7 @@ class ScoringService:
             "overall_score": overall,
             "recommendation": recommendation,
             "reasoning": reasoning,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
         supabase.table("interview_scores").insert(data).execute()
     
@@ -1,9 +1,32 @@
 import uuid
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from postgrest import ReturnMethod
 from src.db.supabase_client import supabase
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# Request-scoped session cache (interview_id -> row). None outside a request,
+# in which case every lookup goes to the DB. asyncio.to_thread copies the
+# context, so worker threads share the same dict as the request handler.
+_request_session_cache: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_session_cache", default=None)
+
+
+def begin_request_cache():
+    """Start a fresh session cache for the current request; returns a reset token"""
+    return _request_session_cache.set({})
+
+
+def end_request_cache(token) -> None:
+    """Discard the current request's session cache"""
+    _request_session_cache.reset(token)
+
+
+def _invalidate_cached_session(interview_id: str) -> None:
+    cache = _request_session_cache.get()
+    if cache is not None:
+        cache.pop(interview_id, None)
+
 class SessionService:
     """Handles interview session database operations"""
     
@@ -39,16 +62,47 @@ class SessionService:
             "status": "CREATED",
             "channel": channel,
             "consent_status": "pending" if consent_required else "not_required",
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
         
-        supabase.table("interview_sessions").insert(data).execute()
+        supabase.table("interview_sessions").insert(data, returning=ReturnMethod.minimal).execute()
         return interview_id
     
     @staticmethod
     def get_session(interview_id: str) -> Optional[Dict[str, Any]]:
-        """Get interview session by ID"""
+        """Get interview session by ID (memoized for the duration of a request)"""
+        cache = _request_session_cache.get()
+        if cache is not None and interview_id in cache:
+            return cache[interview_id]
+        
         response = supabase.table("interview_sessions").select("*").eq("id", interview_id).execute()
+        session = response.data[0] if response.data else None
+        if cache is not None and session is not None:
+            cache[interview_id] = session
+        return session
+    
+    @staticmethod
+    def get_session_with_turns(interview_id: str) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get a session and its turns (ordered by turn_no, then timestamp) in one embedded PostgREST query"""
+        response = supabase.table("interview_sessions").select("*, interview_turns(*)").eq("id", interview_id).execute()
+        if not response.data:
+            return None, []
+        session = response.data[0]
+        # Embed order is undefined - sort like QuestionService.iter_turns so the question,
+        # answer and follow-up rows within a turn keep their insertion order
+        turns = sorted(
+            session.pop("interview_turns", None) or [],
+            key=lambda t: (t["turn_no"], t.get("timestamp") or "")
+        )
+        cache = _request_session_cache.get()
+        if cache is not None:
+            cache[interview_id] = session
+        return session, turns
+    
+    @staticmethod
+    def get_report_row(interview_id: str) -> Optional[Dict[str, Any]]:
+        """Session fields with its scores and signals rows, from the interview_report_v view"""
+        response = supabase.table("interview_report_v").select("*").eq("interview_id", interview_id).execute()
         return response.data[0] if response.data else None
     
     @staticmethod
@@ -56,28 +110,40 @@ class SessionService:
         """Update session status and other fields"""
         update_data = {"status": status}
         update_data.update(kwargs)
-        supabase.table("interview_sessions").update(update_data).eq("id", interview_id).execute()
+        supabase.table("interview_sessions").update(update_data, returning=ReturnMethod.minimal).eq("id", interview_id).execute()
+        _invalidate_cached_session(interview_id)
     
     @staticmethod
-    def update_consent(interview_id: str, consent_status: str, consent_text: str = None):
-        """Update consent status"""
+    def update_consent(interview_id: str, consent_status: str, consent_text: str = None, status: str = None):
+        """Update consent status (and the session status in the same write when given)"""
         data = {"consent_status": consent_status}
         if consent_text:
             data["consent_text"] = consent_text
-        supabase.table("interview_sessions").update(data).eq("id", interview_id).execute()
+        if status:
+            data["status"] = status
+        supabase.table("interview_sessions").update(data, returning=ReturnMethod.minimal).eq("id", interview_id).execute()
+        _invalidate_cached_session(interview_id)
     
     @staticmethod
     def start_interview(interview_id: str):
         """Mark interview as started"""
         supabase.table("interview_sessions").update({
             "status": "INTERVIEW_IN_PROGRESS",
-            "started_at": datetime.utcnow().isoformat()
-        }).eq("id", interview_id).execute()
+            "started_at": datetime.now(timezone.utc).isoformat()
+        }, returning=ReturnMethod.minimal).eq("id", interview_id).execute()
+        _invalidate_cached_session(interview_id)
     
     @staticmethod
     def finish_interview(interview_id: str):
         """Mark interview as completed"""
         supabase.table("interview_sessions").update({
             "status": "COMPLETED",
-            "ended_at": datetime.utcnow().isoformat()
-        }).eq("id", interview_id).execute()
+            "ended_at": datetime.now(timezone.utc).isoformat()
+        }, returning=ReturnMethod.minimal).eq("id", interview_id).execute()
+        _invalidate_cached_session(interview_id)
+    
+    @staticmethod
+    def finish_interview_with_results(interview_id: str, payload: Dict[str, Any]):
+        """Save scores, signals and COMPLETED status in one transaction (migration 003 RPC)"""
+        supabase.rpc("finish_interview", {"iid": interview_id, "payload": payload}).execute()
+        _invalidate_cached_session(interview_id)
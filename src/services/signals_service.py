@@ -1,15 +1,40 @@
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict, Any
 from src.db.supabase_client import supabase
 
+SENTIMENT_CACHE_MAX_SIZE = 256
+
+# OPTIMIZATION: sentiment memoized on the analysed texts, so a retried or repeated
+# finish for the same transcript doesn't pay another LLM round trip
+_sentiment_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_sentiment_cache_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_groq_client():
+    """Shared Groq client (keeps its HTTP connection pool across calls)"""
+    from groq import Groq
+    from src.config import GROQ_API_KEY
+    return Groq(api_key=GROQ_API_KEY)
+
 class SignalsService:
     """Handles real-time interview signals"""
     
     @staticmethod
     def calculate_signals(interview_id: str, turns: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate interview signals from turns"""
-        candidate_turns = [t for t in turns if t["speaker"] == "candidate"]
-        agent_turns = [t for t in turns if t["speaker"] == "agent"]
+        # OPTIMIZATION: one pass collects candidate turns and both word counts
+        candidate_turns = []
+        candidate_words = agent_words = 0
+        for t in turns:
+            speaker = t["speaker"]
+            if speaker == "candidate":
+                candidate_turns.append(t)
+                candidate_words += len(t["text"].split())
+            elif speaker == "agent":
+                agent_words += len(t["text"].split())
         
         if not candidate_turns:
             return {
@@ -20,9 +45,6 @@ class SignalsService:
                 "call_quality_score": 85
             }
         
-        # Calculate word counts
-        candidate_words = sum(len(t["text"].split()) for t in candidate_turns)
-        agent_words = sum(len(t["text"].split()) for t in agent_turns)
         total_words = candidate_words + agent_words
         
         talk_ratio = candidate_words / total_words if total_words > 0 else 0
@@ -49,17 +71,23 @@ class SignalsService:
     def _basic_sentiment(turns: List[Dict[str, Any]]) -> str:
         """LLM-based sentiment analysis for interview responses using Groq"""
         try:
-            from groq import Groq
-            from src.config import GROQ_API_KEY, GROQ_MODEL
+            from src.config import GROQ_MODEL
             
-            client = Groq(api_key=GROQ_API_KEY)
+            client = _get_groq_client()
             
             # Combine all candidate responses
-            text = " ".join([t["text"] for t in turns[:5]])  # First 5 responses
+            texts = tuple(t["text"] for t in turns[:5])  # First 5 responses
+            text = " ".join(texts)
             
             if len(text) < 50:  # Too short to analyze
                 return "neutral"
             
+            with _sentiment_cache_lock:
+                cached = _sentiment_cache.get(texts)
+                if cached is not None:
+                    _sentiment_cache.move_to_end(texts)
+                    return cached
+            
             prompt = f"""Analyze the overall sentiment/tone of these interview responses. 
             
 Candidate responses:
@@ -90,10 +118,14 @@ Sentiment:"""
             sentiment = "".join(c for c in sentiment if c.isalpha())
             
             # Validate response
-            if sentiment in ['positive', 'neutral', 'negative']:
-                return sentiment
-            else:
-                return "neutral"
+            if sentiment not in ['positive', 'neutral', 'negative']:
+                sentiment = "neutral"
+            
+            with _sentiment_cache_lock:
+                _sentiment_cache[texts] = sentiment
+                while len(_sentiment_cache) > SENTIMENT_CACHE_MAX_SIZE:
+                    _sentiment_cache.popitem(last=False)
+            return sentiment
                 
         except Exception as e:
             print(f"Sentiment analysis error: {e}, falling back to neutral")
@@ -113,7 +145,7 @@ Sentiment:"""
             "sentiment": signals["sentiment"],
             "speech_rate_wpm": signals["speech_rate_wpm"],
             "call_quality_score": signals["call_quality_score"],
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
         supabase.table("interview_signals").insert(data).execute()
     
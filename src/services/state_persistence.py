@@ -1,6 +1,6 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from src.db.supabase_client import supabase
 from src.agents.candidate_state import CandidateState
 
@@ -8,6 +8,7 @@ class StatePersistence:
     """Handles saving and loading candidate state to/from database"""
     
     TABLE_NAME = "candidate_states"
+    PAGE_SIZE = 200
     
     @staticmethod
     def save_state(state: CandidateState) -> bool:
@@ -16,7 +17,7 @@ class StatePersistence:
             data = {
                 "interview_id": state.interview_id,
                 "state_data": state.to_dict(),
-                "last_updated": datetime.utcnow().isoformat()
+                "last_updated": datetime.now(timezone.utc).isoformat()
             }
             
             # Upsert (insert or update)
@@ -77,13 +78,18 @@ class StatePersistence:
             return False
     
     @staticmethod
-    def get_all_states() -> list:
-        """Get all candidate states (for debugging/admin)"""
-        try:
+    def iter_all_states(page_size: int = PAGE_SIZE) -> Iterator[CandidateState]:
+        """Yield all candidate states, one page (range request) at a time (for debugging/admin)"""
+        offset = 0
+        while True:
             response = supabase.table(StatePersistence.TABLE_NAME)\
-                .select("*")\
+                .select("state_data")\
+                .order("interview_id")\
+                .range(offset, offset + page_size - 1)\
                 .execute()
-            return [CandidateState.from_dict(row["state_data"]) for row in response.data]
-        except Exception as e:
-            print(f"Error getting all states: {e}")
-            return []
+            rows = response.data or []
+            for row in rows:
+                yield CandidateState.from_dict(row["state_data"])
+            if len(rows) < page_size:
+                return
+            offset += page_size
@@ -1,5 +1,29 @@
+import re
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Any
-from src.services.question_service import QuestionService
+
+# HIGH-VALUE FILTER: generic placeholder strengths
+_LOW_VALUE_PHRASES = ("provided a response", "completed turn", "answered the question")
+# DEPTH FIX: generic nitpicks ignored as concerns
+_GENERIC_PHRASES = ("could elaborate more", "more specific details", "show deeper understanding", "expand technical points")
+
+# OPTIMIZATION: one C-level scan per string instead of a Python any() over every phrase
+# (stdlib stand-in for an Aho-Corasick automaton - same single-pass multi-literal match)
+_LOW_VALUE_RE = re.compile("|".join(map(re.escape, _LOW_VALUE_PHRASES)))
+_GENERIC_RE = re.compile("|".join(map(re.escape, _GENERIC_PHRASES)))
+
+# GIBBERISH SAFETY: orientation turns where gibberish flags are false positives
+_ORIENTATION_TYPES = frozenset({"warmup", "candidate_questions", "wrapup"})
+# Categories whose second-chance tracking uses the technical score (else communication)
+_TECHNICAL_TYPES = frozenset({"technical", "scenario"})
+
+# Highlights / concerns kept in the summary
+_MAX_SUMMARY_ITEMS = 5
+
+# Distinct (scores, evaluation signature) inputs remembered by _decide_recommendation
+RECOMMENDATION_CACHE_MAX_SIZE = 4096
 
 class SummaryService:
     """Generates interview summaries and recommendations"""
@@ -9,20 +33,27 @@ class SummaryService:
                         evaluations: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate executive summary from interview"""
         
-        # Extract candidate turns
-        candidate_turns = [t for t in turns if t["speaker"] == "candidate"]
+        # Count candidate answers (the turns themselves aren't needed)
+        num_answers = sum(1 for t in turns if t["speaker"] == "candidate")
+        
+        # OPTIMIZATION: one pass over the evaluations feeds highlights, concerns and the recommendation
+        aggregate = SummaryService._aggregate_evaluations(evaluations)
+        
+        # OPTIMIZATION: read the dimension scores once for both helpers
+        technical_score = scores.get("technical", 0)
+        communication_score = scores.get("communication", 0)
         
         # Generate highlights and concerns based on scores and evaluations
-        highlights = SummaryService._generate_highlights(scores, evaluations)
-        concerns = SummaryService._generate_concerns(scores, evaluations, candidate_turns)
+        highlights = SummaryService._generate_highlights(technical_score, communication_score, aggregate)
+        concerns = SummaryService._generate_concerns(technical_score, communication_score, aggregate, num_answers)
         
         # Determine recommendation
-        num_answers = len(candidate_turns)
         recommendation, reasoning = SummaryService._determine_recommendation(
             overall_score=scores.get("overall", 0), 
             num_questions=num_answers,
             scores=scores,
-            evaluations=evaluations
+            evaluations=evaluations,
+            aggregate=aggregate
         )
         
         return {
@@ -35,77 +66,86 @@ class SummaryService:
         }
     
     @staticmethod
-    def _generate_highlights(scores: Dict[str, Any], evaluations: List[Dict[str, Any]]) -> List[str]:
-        """Generate highlights from actual evaluations"""
+    def _generate_highlights(technical_score: int, communication_score: int, aggregate: Dict[str, Any]) -> List[str]:
+        """Generate highlights from actual evaluations (substantial strengths from _aggregate_evaluations)"""
         highlights = []
+        # OPTIMIZATION: hashed dedupe instead of scanning the list; also folds case/whitespace variants
+        seen_highlights = set()
         
-        if evaluations:
-            for eval_data in evaluations:
-                strengths = eval_data.get('strengths', [])
-                for strength in strengths:
-                    # HIGH-VALUE FILTER: Ignore generic placeholders
-                    low_value = ["provided a response", "completed turn", "answered the question"]
-                    is_low_value = any(lv in strength.lower() for lv in low_value)
-                    
-                    if strength and len(strength) > 10 and not is_low_value and strength not in highlights:
-                        highlights.append(strength)
+        for strength in aggregate["strengths"]:
+            # HIGH-VALUE FILTER: Ignore generic placeholders
+            if _LOW_VALUE_RE.search(strength.lower()) is not None:
+                continue
+            
+            key = strength.strip().lower()
+            if key in seen_highlights:
+                continue
+            seen_highlights.add(key)
+            highlights.append(strength)
+            # OPTIMIZATION: the rest would be sliced off below (and the fallback needs < 2)
+            if len(highlights) >= _MAX_SUMMARY_ITEMS:
+                break
         
         # Fallback to score-based
         if len(highlights) < 2:
-            if scores.get("technical", 0) >= 70:
+            if technical_score >= 70:
                 highlights.append("Demonstrated solid technical grasp of core concepts")
-            if scores.get("communication", 0) >= 70:
+            if communication_score >= 70:
                 highlights.append("Maintained clear and professional communication")
         
-        return highlights[:5]
+        return highlights[:_MAX_SUMMARY_ITEMS]
     
     @staticmethod
-    def _generate_concerns(scores: Dict[str, Any], evaluations: List[Dict[str, Any]], turns: List[Any]) -> List[str]:
-        """Generate concerns from actual evaluations"""
+    def _generate_concerns(technical_score: int, communication_score: int, aggregate: Dict[str, Any],
+                           num_answers: int) -> List[str]:
+        """Generate concerns from actual evaluations (substantial improvements from _aggregate_evaluations)"""
         concerns = []
+        seen_concerns = set()
         
-        if evaluations:
-            for eval_data in evaluations:
-                improvements = eval_data.get('improvements', [])
-                for improvement in improvements:
-                    if not improvement: continue
-                    
-                    imp_lower = improvement.lower()
-                    
-                    # DEPTH FIX: Ignore generic nitpicks if the overall assessment is good
-                    generic_keywords = ["could elaborate more", "more specific details", "show deeper understanding", "expand technical points"]
-                    is_generic = any(kw in imp_lower for kw in generic_keywords)
-                    
-                    # Also catch "Expand [X] technical points" variants
-                    if "expand" in imp_lower and "technical" in imp_lower and "point" in imp_lower:
-                        is_generic = True
-                    
-                    # GIBBERISH SAFETY: Ignore gibberish/invalid flags for orientation/wrapup turns
-                    q_type = eval_data.get('type', 'technical').lower()
-                    is_false_gibberish = q_type in ["warmup", "candidate_questions", "wrapup"] and "gibberish" in imp_lower
-                    
-                    # Only include if it's substantial, not generic, not false gibberish
-                    if len(improvement) > 10 and not is_generic and not is_false_gibberish and improvement not in concerns:
-                        concerns.append(improvement)
+        for improvement, q_type in aggregate["improvements"]:
+            imp_lower = improvement.lower()
+            
+            # DEPTH FIX: Ignore generic nitpicks if the overall assessment is good
+            is_generic = _GENERIC_RE.search(imp_lower) is not None
+            
+            # Also catch "Expand [X] technical points" variants
+            if "expand" in imp_lower and "technical" in imp_lower and "point" in imp_lower:
+                is_generic = True
+            
+            # GIBBERISH SAFETY: Ignore gibberish/invalid flags for orientation/wrapup turns
+            is_false_gibberish = q_type in _ORIENTATION_TYPES and "gibberish" in imp_lower
+            
+            # Only include if it's not generic and not false gibberish
+            if not is_generic and not is_false_gibberish:
+                key = improvement.strip().lower()
+                if key in seen_concerns:
+                    continue
+                seen_concerns.add(key)
+                concerns.append(improvement)
+                # OPTIMIZATION: the rest would be sliced off below - with a full list the
+                # fallback is skipped and the termination note lands past the slice anyway
+                if len(concerns) >= _MAX_SUMMARY_ITEMS:
+                    break
         
         # Fallback to score-based
         if len(concerns) < 1:
-            if scores.get("technical", 0) < 60:
+            if technical_score < 60:
                 concerns.append("Limited depth shown in technical explanations")
-            if scores.get("communication", 0) < 60:
+            if communication_score < 60:
                 concerns.append("Communication could be more structured")
             
         # Add termination note if too few questions
         # ACCURACY FIX: The core plan is 8 questions. Intro and Wrapup are extra.
         # If we have 8+ answers, the interview is sufficiently complete.
-        if len(turns) < 8: 
+        if num_answers < 8: 
             concerns.append("Interview ended prematurely - insufficient signal gathered for a full evaluation")
             
-        return concerns[:5]
+        return concerns[:_MAX_SUMMARY_ITEMS]
     
     @staticmethod
     def _determine_recommendation(overall_score: int, num_questions: int, scores: Dict[str, Any] = None, 
-                                 evaluations: List[Dict[str, Any]] = None) -> tuple[str, str]:
+                                 evaluations: List[Dict[str, Any]] = None,
+                                 aggregate: Dict[str, Any] = None) -> tuple[str, str]:
         """
         Determine recommendation based on multiple signals with detailed reasoning.
         
@@ -114,26 +154,94 @@ class SummaryService:
         # Extract additional signals
         technical_score = scores.get("technical", 0) if scores else 0
         communication_score = scores.get("communication", 0) if scores else 0
-        culture_score = scores.get("culture", 0) if scores else 0
+        job_id = scores.get("job_id", "") if scores else ""
+        is_senior = "SENIOR" in str(job_id).upper() or "EXPERIENCED" in str(job_id).upper()
+        
+        if aggregate is None:
+            aggregate = SummaryService._aggregate_evaluations(evaluations)
+        signature = (
+            aggregate["red_flag_count"],
+            len(aggregate["improvements"]),
+            len(aggregate["strengths"]),
+            aggregate["irrelevance_count"],
+            aggregate["recovery"]
+        )
         
-        # Count red/green flags from evaluations
-        actual_red_flags = []
+        # OPTIMIZATION: the decision is a pure function of these scalars - repeated summaries
+        # of the same interview (retries, re-renders) become a cache lookup
+        return SummaryService._decide_recommendation(
+            overall_score, num_questions, technical_score, communication_score, is_senior, signature
+        )
+    
+    @staticmethod
+    def _is_irrelevant(eval_data: Dict[str, Any]) -> bool:
+        """Gaming detection marker anywhere in the evaluation (red_flags or brief_reasoning)"""
+        text = str(eval_data).lower()
+        return "irrelevant answer" in text or "repetitive content" in text
+    
+    @staticmethod
+    def _aggregate_evaluations(evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Single pass over the evaluations:
+        strengths - substantial (> 10 chars) strengths, in order
+        improvements - substantial improvements as (text, lowercased question type), in order
+        red_flag_count, irrelevance_count - counts for the recommendation
+        recovery - (type, has_recovery, has_failed_double_chance) for the second-chance rule
+        """
+        strengths = []
         improvements = []
-        green_flags = []
-        if evaluations:
-            for eval_data in evaluations:
-                actual_red_flags.extend(eval_data.get('red_flags', []))
-                improvements.extend(eval_data.get('improvements', []))
-                green_flags.extend(eval_data.get('strengths', []))
+        red_flag_count = irrelevance_count = 0
+        evals_by_type = defaultdict(list)
+        for eval_data in evaluations or ():
+            for f in eval_data.get('red_flags', []):
+                if f and len(f) > 10:
+                    red_flag_count += 1
+            q_type = None
+            for i in eval_data.get('improvements', []):
+                if i and len(i) > 10:
+                    if q_type is None:
+                        q_type = eval_data.get('type', 'technical').lower()
+                    improvements.append((i, q_type))
+            for g in eval_data.get('strengths', []):
+                if g and len(g) > 10:
+                    strengths.append(g)
+            
+            # Gaming detection: render + lowercase each evaluation once, not once per phrase
+            if SummaryService._is_irrelevant(eval_data):
+                irrelevance_count += 1
+            
+            # Group evaluations by type to check for recovery
+            t = eval_data.get("type", "other").lower()
+            evals_by_type[t].append(eval_data.get("technical", 0) if t in _TECHNICAL_TYPES else eval_data.get("communication", 0))
         
-        red_flag_count = len([f for f in actual_red_flags if f and len(f) > 10])
-        improvement_count = len([i for i in improvements if i and len(i) > 10])
-        green_flag_count = len([g for g in green_flags if g and len(g) > 10])
+        # Check if a second-chance was successfully passed (last score > first score in a category with 3+ turns)
+        recovery = (None, False, False)
+        for t, ss in evals_by_type.items():
+            if len(ss) >= 3:
+                if ss[-1] >= 7 and ss[0] < 5:
+                    recovery = (t, True, False)
+                elif ss[-1] < 5 and ss[0] < 5:
+                    recovery = (t, False, True)
+                break
+        
+        return {
+            "strengths": strengths,
+            "improvements": improvements,
+            "red_flag_count": red_flag_count,
+            "irrelevance_count": irrelevance_count,
+            "recovery": recovery
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=RECOMMENDATION_CACHE_MAX_SIZE)
+    def _decide_recommendation(overall_score: int, num_questions: int, technical_score: int,
+                               communication_score: int, is_senior: bool, signature: tuple) -> tuple[str, str]:
+        """Decision tree over the score and evaluation signals; returns (recommendation, reasoning)"""
+        red_flag_count, improvement_count, green_flag_count, irrelevance_count, recovery = signature
         
         # ====================
         # TOP PRIORITY: QUALITY CONTROL (Gaming Detection)
         # ====================
-        irrelevance_count = sum(1 for e in evaluations if "irrelevant answer" in str(e).lower() or "repetitive content" in str(e).lower())
         if irrelevance_count >= 2:
             return "REJECT", "Candidate provided too many irrelevant or repetitive answers, indicating poor listening, understanding, or attempt to game the system."
 
@@ -194,19 +302,16 @@ class SummaryService:
                 reasons.append("positive signal ratio")
             
             # Check disqualifiers
-            # Logic: In longer interviews, more minor improvements are expected.
-            # Only trigger HOLD if improvements are > 1.25x the number of turns.
-            max_improvements = max(10, int(num_questions * 1.25))
-            
             if red_flag_count >= 3: # Increased from 2
                 return "HOLD", f"Potential candidate ({overall_score}/100) but has {red_flag_count} red flags - technical deep-dive recommended"
             
-            # EXCEPTION: If overall score is excellent (>= 80), allow more improvements
+            # Logic: In longer interviews, more minor improvements are expected.
+            # Only trigger HOLD if improvements are > 1.25x the number of turns.
+            # EXCEPTION: If overall score is excellent (>= 80), this check doesn't apply
             # High performers often get many nitpicky "improvements" from the LLM
-            if overall_score >= 80:
-                 max_improvements = max_improvements * 1.5
-            
-            if improvement_count >= max_improvements and overall_score < 80:
+            # OPTIMIZATION: threshold only computed when it can matter (the old 1.5x scaling
+            # for >= 80 was never read, since the check itself required < 80)
+            if overall_score < 80 and improvement_count >= max(10, int(num_questions * 1.25)):
                 return "HOLD", f"Good overall score ({overall_score}/100) but numerous improvement areas identified ({improvement_count}) - review specific feedback"
             
             if technical_score < 60 and technical_score > 0:
@@ -241,28 +346,10 @@ class SummaryService:
             
             # Borderline overall score
             if 60 <= overall_score < 75:
-                # Group evaluations by type to check for recovery
-                evals_by_type = {}
-                if evaluations:
-                    for e in evaluations:
-                        t = e.get("type", "other").lower()
-                        if t not in evals_by_type: evals_by_type[t] = []
-                        evals_by_type[t].append(e.get("technical", 0) if t in ["technical", "scenario"] else e.get("communication", 0))
-
-                # Check if a second-chance was successfully passed (last score > first score in a category with 3+ turns)
-                has_recovery = False
-                has_failed_double_chance = False
-                for t, ss in evals_by_type.items():
-                    if len(ss) >= 3:
-                        if ss[-1] >= 7 and ss[0] < 5:
-                            has_recovery = True
-                        elif ss[-1] < 5 and ss[0] < 5:
-                            has_failed_double_chance = True
-                        break
+                # Second-chance outcome (first category with 3+ turns), from the evaluation signature
+                t, has_recovery, has_failed_double_chance = recovery
 
                 # NEW: Fresher/Junior roles get a 'PROCEED' if they are in the high-60s/low-70s with NO red flags
-                job_id = scores.get("job_id", "") if scores else ""
-                is_senior = "SENIOR" in str(job_id).upper() or "EXPERIENCED" in str(job_id).upper()
                 
                 # If they recovered, enforce a HOLD instead of a direct PROCEED per user request
                 if has_recovery and overall_score >= 65:
@@ -294,4 +381,4 @@ class SummaryService:
     @staticmethod
     def _areas_to_probe(concerns: List[str]) -> List[str]:
         """Suggest areas to probe"""
-        return [f"Deep dive on: {concern}" for concern in concerns[:3]]
+        return [f"Deep dive on: {concern}" for concern in islice(concerns, 3)]